@@ -7,33 +7,122 @@ Improved benchmarking approach:
 - Runs operations in batches to reduce measurement overhead
 - Provides ops/sec for easier interpretation
 - Uses multiple samples for statistical robustness
+- Streams one JSON result per line (JSONL) to stdout as benchmarks finish,
+  or a single struct-of-arrays object with the "soa" config
 """
 
+import io
 import json
+import math
+import multiprocessing
+import os
+import statistics
 import sys
 import time
 import traceback
-from typing import Any, Dict
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
 # Benchmark configuration (can be overridden from stdin)
 MIN_SAMPLE_TIME_MS = 100  # Minimum time per sample (reduces noise)
 TARGET_SAMPLES = 5  # Number of samples to collect for statistics
+PREALLOCATE_OUTPUTS = False  # Write results into a reused buffer (OUT_OPS)
+
+# Calibration limits
+CALIBRATION_PROBE_NS = 100_000  # Time budget for the calibration probe batch
+MAX_PROBE_OPS = 1000  # Most calls in a calibration probe batch
+MAX_OPS_PER_SAMPLE = 100000  # Cap to prevent too-long samples
+
+# Ops that lean on a multithreaded BLAS; never run these in the process pool
+BLAS_OPS = frozenset(("matmul", "dot", "tensordot"))
+BLAS_THREAD_VARS = ("OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "OMP_NUM_THREADS")
+
+
+@dataclass(slots=True)
+class Spec:
+    """A benchmark specification as sent by the TypeScript runner"""
+
+    name: str
+    operation: str
+    setup: Dict[str, Any]
+    warmup: int
+    backend: str = "numpy"
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "Spec":
+        """Build from a decoded JSON spec, ignoring TS-only fields (category, ...)"""
+        return cls(
+            name=raw["name"],
+            operation=raw["operation"],
+            setup=raw["setup"],
+            warmup=raw["warmup"],
+            backend=raw.get("backend", "numpy"),
+        )
 
 
-def setup_arrays(setup: Dict[str, Any], operation: str = None) -> Dict[str, np.ndarray]:
-    """Create arrays based on setup specification"""
-    import io
+# Shared generator for "random" fills; set BENCHMARK_SEED for reproducible data
+_seed = os.environ.get("BENCHMARK_SEED")
+_RNG = np.random.default_rng(int(_seed) if _seed else None)
+
+# Setup keys holding scalars/tuples rather than arrays
+SCALAR_KEYS = frozenset(
+    ("n", "axis", "new_shape", "shape", "fill_value", "target_shape", "dims", "kth")
+)
+
+
+# Setups reused by later benchmarks, least recently used first. Bounded by the
+# bytes they hold rather than by count, so --large inputs don't pile up.
+SETUP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_SETUP_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _setup_nbytes(arrays: Dict[str, Any]) -> int:
+    """Bytes held by a cached setup (arrays and pre-serialized payloads)"""
+    return sum(
+        v.nbytes if isinstance(v, np.ndarray) else len(v)
+        for v in arrays.values()
+        if isinstance(v, (np.ndarray, bytes))
+    )
+
+
+def _trim_setup_cache() -> None:
+    """Evict least recently used setups until under budget (keeps the newest)"""
+    total = sum(_setup_nbytes(arrays) for arrays in _SETUP_CACHE.values())
+    while total > SETUP_CACHE_MAX_BYTES and len(_SETUP_CACHE) > 1:
+        _, evicted = _SETUP_CACHE.popitem(last=False)
+        total -= _setup_nbytes(evicted)
+
+
+def _cached_arrays(setup_key: str) -> Dict[str, Any]:
+    """The built setup for a JSON-encoded setup spec, from the cache if present"""
+    arrays = _SETUP_CACHE.get(setup_key)
+    if arrays is None:
+        arrays = _SETUP_CACHE[setup_key] = _build_arrays(setup_key)
+        _trim_setup_cache()
+    else:
+        _SETUP_CACHE.move_to_end(setup_key)
+    return arrays
+
+
+def _build_arrays(setup_key: str) -> Dict[str, Any]:
+    """Build the arrays for a JSON-encoded setup spec"""
     arrays = {}
 
-    for key, spec in setup.items():
+    for key, spec in json.loads(setup_key).items():
         shape = spec["shape"]
-        dtype = spec.get("dtype", "float64")
-        fill_type = spec.get("fill", "zeros")
 
         # Handle scalar values (n, axis, new_shape, shape, fill_value, target_shape, dims, kth)
-        if key in ["n", "axis", "new_shape", "shape", "fill_value", "target_shape", "dims", "kth"]:
+        if key in SCALAR_KEYS:
             if len(shape) == 1:
                 arrays[key] = shape[0]
             else:
@@ -50,6 +139,9 @@ def setup_arrays(setup: Dict[str, Any], operation: str = None) -> Dict[str, np.n
             arrays[key] = spec.get("value")
             continue
 
+        dtype = spec.get("dtype", "float64")
+        fill_type = spec.get("fill", "zeros")
+
         # Check 'value' first to avoid default fill creating zeros
         if "value" in spec:
             arrays[key] = np.full(shape, spec["value"], dtype=dtype)
@@ -58,443 +150,646 @@ def setup_arrays(setup: Dict[str, Any], operation: str = None) -> Dict[str, np.n
         elif fill_type == "ones":
             arrays[key] = np.ones(shape, dtype=dtype)
         elif fill_type == "random":
-            arrays[key] = np.random.randn(*shape).astype(dtype)
+            if dtype in ("float32", "float64"):
+                # Generated directly in the target dtype, no float64 copy
+                arrays[key] = _RNG.standard_normal(shape, dtype=dtype)
+            else:
+                arrays[key] = _RNG.standard_normal(shape).astype(dtype)
         elif fill_type == "arange":
-            arrays[key] = np.arange(np.prod(shape), dtype=dtype).reshape(shape)
+            arrays[key] = np.arange(math.prod(shape), dtype=dtype).reshape(shape)
+
+        # Copy to contiguous once here (a no-op when already C-contiguous) so
+        # every op sees inputs NumPy can run its SIMD inner loops on. Ops like
+        # transpose/swapaxes build their strided views inside the timed call.
+        # np.require rather than ascontiguousarray, which turns 0-d into 1-d.
+        if key in arrays:
+            arrays[key] = np.require(arrays[key], requirements="C")
+
+    return arrays
+
+
+def setup_arrays(setup: Dict[str, Any], operation: str = None) -> Dict[str, np.ndarray]:
+    """
+    Create arrays based on setup specification
+
+    Arrays are shared between benchmarks with an identical setup spec, so
+    operations must not modify their inputs. The returned dict itself is a
+    fresh copy and may be extended freely.
+    """
+    # The cached dict also holds pre-serialized IO payloads, built lazily on
+    # the first benchmark that needs them and evicted along with the arrays
+    arrays = _cached_arrays(json.dumps(setup, sort_keys=True))
 
     # Pre-serialize data for parsing benchmarks
     if operation == "parseNpy" and "a" in arrays:
-        buffer = io.BytesIO()
-        np.save(buffer, arrays["a"])
-        arrays["_npyBytes"] = buffer.getvalue()
+        if "_npyBytes" not in arrays:
+            buffer = io.BytesIO()
+            np.save(buffer, arrays["a"])
+            arrays["_npyBytes"] = buffer.getvalue()
     elif operation == "serializeNpzSync" and "a" in arrays:
         # Create dict of arrays for NPZ serialization
-        npz_arrays = {k: v for k, v in arrays.items() if isinstance(v, np.ndarray)}
-        arrays["_npzArrays"] = npz_arrays
+        if "_npzArrays" not in arrays:
+            npz_arrays = {k: v for k, v in arrays.items() if isinstance(v, np.ndarray)}
+            arrays["_npzArrays"] = npz_arrays
     elif operation == "parseNpzSync" and "a" in arrays:
         # Create and pre-serialize NPZ
-        npz_arrays = {k: v for k, v in arrays.items() if isinstance(v, np.ndarray)}
-        buffer = io.BytesIO()
-        np.savez(buffer, **npz_arrays)
-        arrays["_npzBytes"] = buffer.getvalue()
+        if "_npzBytes" not in arrays:
+            npz_arrays = {k: v for k, v in arrays.items() if isinstance(v, np.ndarray)}
+            buffer = io.BytesIO()
+            np.savez(buffer, **npz_arrays)
+            arrays["_npzBytes"] = buffer.getvalue()
 
-    return arrays
+    # Payloads may have grown this entry past the budget
+    if operation in ("parseNpy", "parseNpzSync"):
+        _trim_setup_cache()
+
+    return dict(arrays)
+
+
+# Reused by the serialize benchmarks instead of allocating a buffer per call
+_BUF = io.BytesIO()
 
 
-def execute_operation(operation: str, arrays: Dict[str, np.ndarray]) -> Any:
-    """Execute the benchmark operation"""
+def _serialize_npy(arrays: Dict[str, Any]) -> bytes:
+    _BUF.seek(0)
+    _BUF.truncate(0)
+    np.save(_BUF, arrays["a"])
+    return _BUF.getvalue()
+
+
+def _parse_npy(arrays: Dict[str, Any]) -> np.ndarray:
+    # arrays["_npyBytes"] should be pre-serialized
+    buffer = io.BytesIO(arrays["_npyBytes"])
+    return np.load(buffer)
+
+
+def _serialize_npz(arrays: Dict[str, Any]) -> bytes:
+    _BUF.seek(0)
+    _BUF.truncate(0)
+    np.savez(_BUF, **arrays["_npzArrays"])
+    return _BUF.getvalue()
+
+
+def _parse_npz(arrays: Dict[str, Any]) -> Any:
+    # arrays["_npzBytes"] should be pre-serialized
+    buffer = io.BytesIO(arrays["_npzBytes"])
+    return np.load(buffer)
+
+
+# Operation name -> callable taking the setup arrays, built once at import so
+# the hot loop pays a single dict lookup instead of walking an if/elif chain
+OPS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
     # Array creation
-    if operation == "zeros":
-        return np.zeros(arrays["shape"])
-    elif operation == "ones":
-        return np.ones(arrays["shape"])
-    elif operation == "empty":
-        return np.empty(arrays["shape"])
-    elif operation == "full":
-        return np.full(arrays["shape"], arrays["fill_value"])
-    elif operation == "arange":
-        return np.arange(arrays["n"])
-    elif operation == "linspace":
-        return np.linspace(0, 100, arrays["n"])
-    elif operation == "logspace":
-        return np.logspace(0, 3, arrays["n"])
-    elif operation == "geomspace":
-        return np.geomspace(1, 1000, arrays["n"])
-    elif operation == "eye":
-        return np.eye(arrays["n"])
-    elif operation == "identity":
-        return np.identity(arrays["n"])
-    elif operation == "copy":
-        return np.copy(arrays["a"])
-    elif operation == "zeros_like":
-        return np.zeros_like(arrays["a"])
-    elif operation == "ones_like":
-        return np.ones_like(arrays["a"])
-    elif operation == "empty_like":
-        return np.empty_like(arrays["a"])
-    elif operation == "full_like":
-        return np.full_like(arrays["a"], 7)
+    "zeros": lambda arrays: np.zeros(arrays["shape"]),
+    "ones": lambda arrays: np.ones(arrays["shape"]),
+    "empty": lambda arrays: np.empty(arrays["shape"]),
+    "full": lambda arrays: np.full(arrays["shape"], arrays["fill_value"]),
+    "arange": lambda arrays: np.arange(arrays["n"]),
+    "linspace": lambda arrays: np.linspace(0, 100, arrays["n"]),
+    "logspace": lambda arrays: np.logspace(0, 3, arrays["n"]),
+    "geomspace": lambda arrays: np.geomspace(1, 1000, arrays["n"]),
+    "eye": lambda arrays: np.eye(arrays["n"]),
+    "identity": lambda arrays: np.identity(arrays["n"]),
+    "copy": lambda arrays: np.copy(arrays["a"]),
+    "zeros_like": lambda arrays: np.zeros_like(arrays["a"]),
+    "ones_like": lambda arrays: np.ones_like(arrays["a"]),
+    "empty_like": lambda arrays: np.empty_like(arrays["a"]),
+    "full_like": lambda arrays: np.full_like(arrays["a"], 7),
 
     # Arithmetic
-    elif operation == "add":
-        return arrays["a"] + arrays["b"]
-    elif operation == "subtract":
-        return arrays["a"] - arrays["b"]
-    elif operation == "multiply":
-        return arrays["a"] * arrays["b"]
-    elif operation == "divide":
-        return arrays["a"] / arrays["b"]
-    elif operation == "mod":
-        return np.mod(arrays["a"], arrays["b"])
-    elif operation == "floor_divide":
-        return np.floor_divide(arrays["a"], arrays["b"])
-    elif operation == "reciprocal":
-        return np.reciprocal(arrays["a"])
-    elif operation == "positive":
-        return np.positive(arrays["a"])
-    elif operation == "cbrt":
-        return np.cbrt(arrays["a"])
-    elif operation == "fabs":
-        return np.fabs(arrays["a"])
-    elif operation == "divmod":
-        q, r = np.divmod(arrays["a"], arrays["b"])
-        return q  # Just return quotient for benchmarking
+    "add": lambda arrays: arrays["a"] + arrays["b"],
+    "subtract": lambda arrays: arrays["a"] - arrays["b"],
+    "multiply": lambda arrays: arrays["a"] * arrays["b"],
+    "divide": lambda arrays: arrays["a"] / arrays["b"],
+    "mod": lambda arrays: np.mod(arrays["a"], arrays["b"]),
+    "floor_divide": lambda arrays: np.floor_divide(arrays["a"], arrays["b"]),
+    "reciprocal": lambda arrays: np.reciprocal(arrays["a"]),
+    "positive": lambda arrays: np.positive(arrays["a"]),
+    "cbrt": lambda arrays: np.cbrt(arrays["a"]),
+    "fabs": lambda arrays: np.fabs(arrays["a"]),
+    "divmod": lambda arrays: np.divmod(arrays["a"], arrays["b"])[0],  # Just return quotient for benchmarking
 
     # Mathematical operations
-    elif operation == "sqrt":
-        return np.sqrt(arrays["a"])
-    elif operation == "power":
-        return np.power(arrays["a"], arrays["b"])
-    elif operation == "absolute":
-        return np.absolute(arrays["a"])
-    elif operation == "negative":
-        return np.negative(arrays["a"])
-    elif operation == "sign":
-        return np.sign(arrays["a"])
+    "sqrt": lambda arrays: np.sqrt(arrays["a"]),
+    "power": lambda arrays: np.power(arrays["a"], arrays["b"]),
+    "absolute": lambda arrays: np.absolute(arrays["a"]),
+    "negative": lambda arrays: np.negative(arrays["a"]),
+    "sign": lambda arrays: np.sign(arrays["a"]),
 
     # Trigonometric
-    elif operation == "sin":
-        return np.sin(arrays["a"])
-    elif operation == "cos":
-        return np.cos(arrays["a"])
-    elif operation == "tan":
-        return np.tan(arrays["a"])
-    elif operation == "arctan2":
-        return np.arctan2(arrays["a"], arrays["b"])
-    elif operation == "hypot":
-        return np.hypot(arrays["a"], arrays["b"])
+    "sin": lambda arrays: np.sin(arrays["a"]),
+    "cos": lambda arrays: np.cos(arrays["a"]),
+    "tan": lambda arrays: np.tan(arrays["a"]),
+    "arctan2": lambda arrays: np.arctan2(arrays["a"], arrays["b"]),
+    "hypot": lambda arrays: np.hypot(arrays["a"], arrays["b"]),
 
     # Hyperbolic
-    elif operation == "sinh":
-        return np.sinh(arrays["a"])
-    elif operation == "cosh":
-        return np.cosh(arrays["a"])
-    elif operation == "tanh":
-        return np.tanh(arrays["a"])
+    "sinh": lambda arrays: np.sinh(arrays["a"]),
+    "cosh": lambda arrays: np.cosh(arrays["a"]),
+    "tanh": lambda arrays: np.tanh(arrays["a"]),
 
     # Linear algebra
-    elif operation == "dot":
-        return np.dot(arrays["a"], arrays["b"])
-    elif operation == "inner":
-        return np.inner(arrays["a"], arrays["b"])
-    elif operation == "outer":
-        return np.outer(arrays["a"], arrays["b"])
-    elif operation == "tensordot":
-        axes = arrays.get("axes", 2)
-        return np.tensordot(arrays["a"], arrays["b"], axes=axes)
-    elif operation == "matmul":
-        return arrays["a"] @ arrays["b"]
-    elif operation == "trace":
-        return np.trace(arrays["a"])
-    elif operation == "transpose":
-        return arrays["a"].T
-    elif operation == "diagonal":
-        return np.diagonal(arrays["a"])
-    elif operation == "kron":
-        return np.kron(arrays["a"], arrays["b"])
-    elif operation == "einsum":
-        return np.einsum(arrays["subscripts"], arrays["a"], arrays["b"])
-    elif operation == "deg2rad":
-        return np.deg2rad(arrays["a"])
-    elif operation == "rad2deg":
-        return np.rad2deg(arrays["a"])
-
-    # Reductions
-    elif operation == "sum":
-        axis = arrays.get("axis")
-        return arrays["a"].sum(axis=axis)
-    elif operation == "mean":
-        axis = arrays.get("axis")
-        return arrays["a"].mean(axis=axis)
-    elif operation == "max":
-        axis = arrays.get("axis")
-        return arrays["a"].max(axis=axis)
-    elif operation == "min":
-        axis = arrays.get("axis")
-        return arrays["a"].min(axis=axis)
-    elif operation == "prod":
-        axis = arrays.get("axis")
-        return arrays["a"].prod(axis=axis)
-    elif operation == "argmin":
-        axis = arrays.get("axis")
-        return arrays["a"].argmin(axis=axis)
-    elif operation == "argmax":
-        axis = arrays.get("axis")
-        return arrays["a"].argmax(axis=axis)
-    elif operation == "var":
-        axis = arrays.get("axis")
-        return arrays["a"].var(axis=axis)
-    elif operation == "std":
-        axis = arrays.get("axis")
-        return arrays["a"].std(axis=axis)
-    elif operation == "all":
-        axis = arrays.get("axis")
-        return arrays["a"].all(axis=axis)
-    elif operation == "any":
-        axis = arrays.get("axis")
-        return arrays["a"].any(axis=axis)
+    "dot": lambda arrays: np.dot(arrays["a"], arrays["b"]),
+    "inner": lambda arrays: np.inner(arrays["a"], arrays["b"]),
+    "outer": lambda arrays: np.outer(arrays["a"], arrays["b"]),
+    "tensordot": lambda arrays: np.tensordot(arrays["a"], arrays["b"], axes=arrays.get("axes", 2)),
+    "matmul": lambda arrays: arrays["a"] @ arrays["b"],
+    "trace": lambda arrays: np.trace(arrays["a"]),
+    "transpose": lambda arrays: arrays["a"].T,
+    "diagonal": lambda arrays: np.diagonal(arrays["a"]),
+    "kron": lambda arrays: np.kron(arrays["a"], arrays["b"]),
+    "einsum": lambda arrays: np.einsum(arrays["subscripts"], arrays["a"], arrays["b"]),
+    "deg2rad": lambda arrays: np.deg2rad(arrays["a"]),
+    "rad2deg": lambda arrays: np.rad2deg(arrays["a"]),
+
+    # Reductions (sum, mean, max, ...) are not listed here: get_operation
+    # binds them with their axis via bind_reduction (see REDUCTION_OPS)
 
     # New reduction functions
-    elif operation == "cumsum":
-        return arrays["a"].cumsum()
-    elif operation == "cumprod":
-        return arrays["a"].cumprod()
-    elif operation == "ptp":
-        return np.ptp(arrays["a"])
-    elif operation == "median":
-        return np.median(arrays["a"])
-    elif operation == "percentile":
-        return np.percentile(arrays["a"], 50)
-    elif operation == "quantile":
-        return np.quantile(arrays["a"], 0.5)
-    elif operation == "average":
-        return np.average(arrays["a"])
-    elif operation == "nansum":
-        return np.nansum(arrays["a"])
-    elif operation == "nanmean":
-        return np.nanmean(arrays["a"])
-    elif operation == "nanmin":
-        return np.nanmin(arrays["a"])
-    elif operation == "nanmax":
-        return np.nanmax(arrays["a"])
+    "cumsum": lambda arrays: arrays["a"].cumsum(),
+    "cumprod": lambda arrays: arrays["a"].cumprod(),
+    "ptp": lambda arrays: np.ptp(arrays["a"]),
+    "median": lambda arrays: np.median(arrays["a"]),
+    "percentile": lambda arrays: np.percentile(arrays["a"], 50),
+    "quantile": lambda arrays: np.quantile(arrays["a"], 0.5),
+    "average": lambda arrays: np.average(arrays["a"]),
+    "nansum": lambda arrays: np.nansum(arrays["a"]),
+    "nanmean": lambda arrays: np.nanmean(arrays["a"]),
+    "nanmin": lambda arrays: np.nanmin(arrays["a"]),
+    "nanmax": lambda arrays: np.nanmax(arrays["a"]),
 
     # Reshape
-    elif operation == "reshape":
-        return arrays["a"].reshape(arrays["new_shape"])
-    elif operation == "flatten":
-        return arrays["a"].flatten()
-    elif operation == "ravel":
-        return arrays["a"].ravel()
-    elif operation == "squeeze":
-        return arrays["a"].squeeze()
+    "reshape": lambda arrays: arrays["a"].reshape(arrays["new_shape"]),
+    "flatten": lambda arrays: arrays["a"].flatten(),
+    "ravel": lambda arrays: arrays["a"].ravel(),
+    "squeeze": lambda arrays: arrays["a"].squeeze(),
 
     # Slicing
-    elif operation == "slice":
-        return arrays["a"][:100, :100]
+    "slice": lambda arrays: arrays["a"][:100, :100],
 
     # Array manipulation
-    elif operation == "swapaxes":
-        return np.swapaxes(arrays["a"], 0, 1)
-    elif operation == "concatenate":
-        return np.concatenate([arrays["a"], arrays["b"]], axis=0)
-    elif operation == "stack":
-        return np.stack([arrays["a"], arrays["b"]], axis=0)
-    elif operation == "vstack":
-        return np.vstack([arrays["a"], arrays["b"]])
-    elif operation == "hstack":
-        return np.hstack([arrays["a"], arrays["b"]])
-    elif operation == "tile":
-        return np.tile(arrays["a"], [2, 2])
-    elif operation == "repeat":
-        return np.repeat(arrays["a"], 2)
+    "swapaxes": lambda arrays: np.swapaxes(arrays["a"], 0, 1),
+    "concatenate": lambda arrays: np.concatenate([arrays["a"], arrays["b"]], axis=0),
+    "stack": lambda arrays: np.stack([arrays["a"], arrays["b"]], axis=0),
+    "vstack": lambda arrays: np.vstack([arrays["a"], arrays["b"]]),
+    "hstack": lambda arrays: np.hstack([arrays["a"], arrays["b"]]),
+    "tile": lambda arrays: np.tile(arrays["a"], [2, 2]),
+    "repeat": lambda arrays: np.repeat(arrays["a"], 2),
 
     # Advanced
-    elif operation == "broadcast_to":
-        return np.broadcast_to(arrays["a"], arrays["target_shape"])
-    elif operation == "take":
-        return np.take(arrays["a"], arrays["indices"])
+    "broadcast_to": lambda arrays: np.broadcast_to(arrays["a"], arrays["target_shape"]),
+    "take": lambda arrays: np.take(arrays["a"], arrays["indices"]),
 
     # New creation functions
-    elif operation == "diag":
-        return np.diag(arrays["a"])
-    elif operation == "tri":
-        return np.tri(arrays["shape"][0], arrays["shape"][1])
-    elif operation == "tril":
-        return np.tril(arrays["a"])
-    elif operation == "triu":
-        return np.triu(arrays["a"])
+    "diag": lambda arrays: np.diag(arrays["a"]),
+    "tri": lambda arrays: np.tri(arrays["shape"][0], arrays["shape"][1]),
+    "tril": lambda arrays: np.tril(arrays["a"]),
+    "triu": lambda arrays: np.triu(arrays["a"]),
 
     # New manipulation functions
-    elif operation == "flip":
-        return np.flip(arrays["a"])
-    elif operation == "rot90":
-        return np.rot90(arrays["a"])
-    elif operation == "roll":
-        return np.roll(arrays["a"], 10)
-    elif operation == "pad":
-        return np.pad(arrays["a"], 2)
+    "flip": lambda arrays: np.flip(arrays["a"]),
+    "rot90": lambda arrays: np.rot90(arrays["a"]),
+    "roll": lambda arrays: np.roll(arrays["a"], 10),
+    "pad": lambda arrays: np.pad(arrays["a"], 2),
 
     # Indexing functions
-    elif operation == "take_along_axis":
-        return np.take_along_axis(arrays["a"], arrays["b"].astype(np.intp), axis=0)
-    elif operation == "compress":
-        return np.compress(arrays["b"].astype(bool), arrays["a"], axis=0)
-    elif operation == "diag_indices":
-        return np.diag_indices(arrays["n"])
-    elif operation == "tril_indices":
-        return np.tril_indices(arrays["n"])
-    elif operation == "triu_indices":
-        return np.triu_indices(arrays["n"])
-    elif operation == "indices":
-        return np.indices(tuple(arrays["shape"]))
-    elif operation == "ravel_multi_index":
-        return np.ravel_multi_index((arrays["a"].astype(np.intp).ravel(), arrays["b"].astype(np.intp).ravel()), tuple(arrays["dims"]))
-    elif operation == "unravel_index":
-        return np.unravel_index(arrays["a"].astype(np.intp).ravel(), tuple(arrays["dims"]))
+    "take_along_axis": lambda arrays: np.take_along_axis(arrays["a"], arrays["b"].astype(np.intp), axis=0),
+    "compress": lambda arrays: np.compress(arrays["b"].astype(bool), arrays["a"], axis=0),
+    "diag_indices": lambda arrays: np.diag_indices(arrays["n"]),
+    "tril_indices": lambda arrays: np.tril_indices(arrays["n"]),
+    "triu_indices": lambda arrays: np.triu_indices(arrays["n"]),
+    "indices": lambda arrays: np.indices(tuple(arrays["shape"])),
+    "ravel_multi_index": lambda arrays: np.ravel_multi_index((arrays["a"].astype(np.intp).ravel(), arrays["b"].astype(np.intp).ravel()), tuple(arrays["dims"])),
+    "unravel_index": lambda arrays: np.unravel_index(arrays["a"].astype(np.intp).ravel(), tuple(arrays["dims"])),
 
     # Bitwise operations
-    elif operation == "bitwise_and":
-        return np.bitwise_and(arrays["a"], arrays["b"])
-    elif operation == "bitwise_or":
-        return np.bitwise_or(arrays["a"], arrays["b"])
-    elif operation == "bitwise_xor":
-        return np.bitwise_xor(arrays["a"], arrays["b"])
-    elif operation == "bitwise_not":
-        return np.bitwise_not(arrays["a"])
-    elif operation == "invert":
-        return np.invert(arrays["a"])
-    elif operation == "left_shift":
-        return np.left_shift(arrays["a"], arrays["b"])
-    elif operation == "right_shift":
-        return np.right_shift(arrays["a"], arrays["b"])
-    elif operation == "packbits":
-        return np.packbits(arrays["a"].astype(np.uint8))
-    elif operation == "unpackbits":
-        return np.unpackbits(arrays["a"].astype(np.uint8))
+    "bitwise_and": lambda arrays: np.bitwise_and(arrays["a"], arrays["b"]),
+    "bitwise_or": lambda arrays: np.bitwise_or(arrays["a"], arrays["b"]),
+    "bitwise_xor": lambda arrays: np.bitwise_xor(arrays["a"], arrays["b"]),
+    "bitwise_not": lambda arrays: np.bitwise_not(arrays["a"]),
+    "invert": lambda arrays: np.invert(arrays["a"]),
+    "left_shift": lambda arrays: np.left_shift(arrays["a"], arrays["b"]),
+    "right_shift": lambda arrays: np.right_shift(arrays["a"], arrays["b"]),
+    "packbits": lambda arrays: np.packbits(arrays["a"].astype(np.uint8)),
+    "unpackbits": lambda arrays: np.unpackbits(arrays["a"].astype(np.uint8)),
 
     # IO operations (NPY/NPZ)
-    elif operation == "serializeNpy":
-        import io
-        buffer = io.BytesIO()
-        np.save(buffer, arrays["a"])
-        return buffer.getvalue()
-    elif operation == "parseNpy":
-        import io
-        # arrays["_npyBytes"] should be pre-serialized
-        buffer = io.BytesIO(arrays["_npyBytes"])
-        return np.load(buffer)
-    elif operation == "serializeNpzSync":
-        import io
-        buffer = io.BytesIO()
-        np.savez(buffer, **arrays["_npzArrays"])
-        return buffer.getvalue()
-    elif operation == "parseNpzSync":
-        import io
-        # arrays["_npzBytes"] should be pre-serialized
-        buffer = io.BytesIO(arrays["_npzBytes"])
-        return np.load(buffer)
+    "serializeNpy": _serialize_npy,
+    "parseNpy": _parse_npy,
+    "serializeNpzSync": _serialize_npz,
+    "parseNpzSync": _parse_npz,
 
     # Sorting operations
-    elif operation == "sort":
-        return np.sort(arrays["a"])
-    elif operation == "argsort":
-        return np.argsort(arrays["a"])
-    elif operation == "partition":
-        kth = arrays.get("kth", 0)
-        return np.partition(arrays["a"], kth)
-    elif operation == "argpartition":
-        kth = arrays.get("kth", 0)
-        return np.argpartition(arrays["a"], kth)
-    elif operation == "lexsort":
-        return np.lexsort((arrays["a"].ravel(), arrays["b"].ravel()))
-    elif operation == "sort_complex":
-        return np.sort_complex(arrays["a"])
+    "sort": lambda arrays: np.sort(arrays["a"]),
+    "argsort": lambda arrays: np.argsort(arrays["a"]),
+    "partition": lambda arrays: np.partition(arrays["a"], arrays.get("kth", 0)),
+    "argpartition": lambda arrays: np.argpartition(arrays["a"], arrays.get("kth", 0)),
+    "lexsort": lambda arrays: np.lexsort((arrays["a"].ravel(), arrays["b"].ravel())),
+    "sort_complex": lambda arrays: np.sort_complex(arrays["a"]),
 
     # Searching operations
-    elif operation == "nonzero":
-        return np.nonzero(arrays["a"])
-    elif operation == "flatnonzero":
-        return np.flatnonzero(arrays["a"])
-    elif operation == "where":
-        return np.where(arrays["a"], arrays["b"], arrays["c"])
-    elif operation == "searchsorted":
-        return np.searchsorted(arrays["a"].ravel(), arrays["b"].ravel())
-    elif operation == "extract":
-        return np.extract(arrays["condition"], arrays["a"])
-    elif operation == "count_nonzero":
-        return np.count_nonzero(arrays["a"])
+    "nonzero": lambda arrays: np.nonzero(arrays["a"]),
+    "flatnonzero": lambda arrays: np.flatnonzero(arrays["a"]),
+    "where": lambda arrays: np.where(arrays["a"], arrays["b"], arrays["c"]),
+    "searchsorted": lambda arrays: np.searchsorted(arrays["a"].ravel(), arrays["b"].ravel()),
+    "extract": lambda arrays: np.extract(arrays["condition"], arrays["a"]),
+    "count_nonzero": lambda arrays: np.count_nonzero(arrays["a"]),
+}
 
-    else:
-        raise ValueError(f"Unknown operation: {operation}")
+
+# Opt-in Numba kernels for elementwise micro-ops, selected with
+# spec.backend == "numba". They measure fused compiled loops rather than
+# NumPy's per-call dispatch; pure NumPy stays the default baseline.
+def _kernel_add(a, b):
+    return a + b
+
+
+def _kernel_subtract(a, b):
+    return a - b
+
+
+def _kernel_multiply(a, b):
+    return a * b
+
+
+def _kernel_divide(a, b):
+    return a / b
+
+
+def _kernel_negative(a):
+    return -a
+
+
+def _kernel_positive(a):
+    return +a
+
+
+def _kernel_absolute(a):
+    return np.abs(a)
+
+
+def _kernel_sign(a):
+    return np.sign(a)
+
+
+def _kernel_reciprocal(a):
+    return np.reciprocal(a)
+
+
+# Operation name -> (Python kernel for Numba to compile, number of inputs)
+NUMBA_SOURCES: Dict[str, Tuple[Callable[..., Any], int]] = {
+    "add": (_kernel_add, 2),
+    "subtract": (_kernel_subtract, 2),
+    "multiply": (_kernel_multiply, 2),
+    "divide": (_kernel_divide, 2),
+    "negative": (_kernel_negative, 1),
+    "positive": (_kernel_positive, 1),
+    "absolute": (_kernel_absolute, 1),
+    "sign": (_kernel_sign, 1),
+    "reciprocal": (_kernel_reciprocal, 1),
+}
+
+
+def _bind_kernel(kernel: Callable[..., Any], arity: int) -> Callable[[Dict[str, Any]], Any]:
+    """Adapt a compiled kernel to the fn(arrays) calling convention"""
+    if arity == 2:
+        return lambda arrays: kernel(arrays["a"], arrays["b"])
+    return lambda arrays: kernel(arrays["a"])
+
+
+@lru_cache(maxsize=None)
+def _load_njit() -> Optional[Callable[..., Any]]:
+    """
+    numba.njit, or None when Numba isn't installed
+
+    Imported on the first numba spec rather than at module load: the import
+    takes a noticeable fraction of a second and would otherwise be paid by
+    every run (and every pool worker) that never asks for the backend.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional; the NumPy baseline never needs it
+        return None
+    return njit
+
+
+# Generic kernels, compiled on first request and typed lazily on first call
+NUMBA_KERNELS: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+
+
+def numba_kernel(operation: str) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Generic Numba kernel for an operation, or None if unavailable"""
+    if operation not in NUMBA_KERNELS:
+        njit = _load_njit()
+        if njit is None or operation not in NUMBA_SOURCES:
+            return None
+        kernel, arity = NUMBA_SOURCES[operation]
+        NUMBA_KERNELS[operation] = _bind_kernel(
+            njit(parallel=True, fastmath=True, cache=True)(kernel), arity
+        )
+    return NUMBA_KERNELS[operation]
+
+
+# Kernels compiled against an explicit signature for the common contiguous
+# float cases, keyed by (op, dtype, ndim, c_contiguous). The stored callable
+# is the compiled overload's entry point rather than the Dispatcher (which
+# would still type-match its arguments on every call); the checks in
+# specialized_kernel guarantee the inputs fit that signature.
+SPECIALIZED_DTYPES = {"float64": "f8", "float32": "f4"}
+SPECIALIZED_NDIMS = (1, 2)
+SPECIALIZED: Dict[Tuple[str, str, int, bool], Callable[..., Any]] = {}
+
+
+def specialized_kernel(
+    operation: str, arrays: Dict[str, Any]
+) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """
+    Kernel compiled for the exact dtype/ndim/layout of this op's inputs
+
+    Returns None (use the generic kernel) unless all inputs share a
+    supported dtype, ndim and shape and are C-contiguous. The entry point
+    doesn't type-check, so those conditions must hold for every call.
+    """
+    njit = _load_njit()
+    if njit is None or operation not in NUMBA_SOURCES:
+        return None
+    kernel, arity = NUMBA_SOURCES[operation]
+    inputs = [arrays.get(key) for key in ("a", "b")[:arity]]
+    first = inputs[0]
+    if not all(
+        isinstance(x, np.ndarray) and x.dtype == first.dtype and x.shape == first.shape
+        for x in inputs
+    ):
+        return None
+
+    key = (operation, first.dtype.name, first.ndim, all(x.flags.c_contiguous for x in inputs))
+    _, dtype, ndim, contiguous = key
+    if dtype not in SPECIALIZED_DTYPES or ndim not in SPECIALIZED_NDIMS or not contiguous:
+        return None
+
+    if key not in SPECIALIZED:
+        # e.g. "f8[:, ::1]" for a C-contiguous 2-D float64 array
+        arg = f"{SPECIALIZED_DTYPES[dtype]}[{', '.join([':'] * (ndim - 1) + ['::1'])}]"
+        signature = f"({', '.join([arg] * arity)},)"
+        dispatcher = njit(signature, parallel=True, fastmath=True, cache=True)(kernel)
+        SPECIALIZED[key] = dispatcher.overloads[dispatcher.signatures[0]].entry_point
+    return _bind_kernel(SPECIALIZED[key], arity)
+
+
+# Variants writing into a preallocated arrays["_out"], so the timed loop
+# measures the computation rather than allocating a fresh result per call.
+# Off by default: numpy-ts allocates its outputs, and so does the baseline.
+OUT_OPS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    # Arithmetic
+    "add": lambda arrays: np.add(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "subtract": lambda arrays: np.subtract(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "multiply": lambda arrays: np.multiply(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "divide": lambda arrays: np.divide(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "mod": lambda arrays: np.mod(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "floor_divide": lambda arrays: np.floor_divide(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "reciprocal": lambda arrays: np.reciprocal(arrays["a"], out=arrays["_out"]),
+    "positive": lambda arrays: np.positive(arrays["a"], out=arrays["_out"]),
+    "cbrt": lambda arrays: np.cbrt(arrays["a"], out=arrays["_out"]),
+    "fabs": lambda arrays: np.fabs(arrays["a"], out=arrays["_out"]),
+
+    # Mathematical operations
+    "sqrt": lambda arrays: np.sqrt(arrays["a"], out=arrays["_out"]),
+    "power": lambda arrays: np.power(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "absolute": lambda arrays: np.absolute(arrays["a"], out=arrays["_out"]),
+    "negative": lambda arrays: np.negative(arrays["a"], out=arrays["_out"]),
+    "sign": lambda arrays: np.sign(arrays["a"], out=arrays["_out"]),
+
+    # Trigonometric
+    "sin": lambda arrays: np.sin(arrays["a"], out=arrays["_out"]),
+    "cos": lambda arrays: np.cos(arrays["a"], out=arrays["_out"]),
+    "tan": lambda arrays: np.tan(arrays["a"], out=arrays["_out"]),
+    "arctan2": lambda arrays: np.arctan2(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "hypot": lambda arrays: np.hypot(arrays["a"], arrays["b"], out=arrays["_out"]),
+
+    # Hyperbolic
+    "sinh": lambda arrays: np.sinh(arrays["a"], out=arrays["_out"]),
+    "cosh": lambda arrays: np.cosh(arrays["a"], out=arrays["_out"]),
+    "tanh": lambda arrays: np.tanh(arrays["a"], out=arrays["_out"]),
+
+    # Angle conversion
+    "deg2rad": lambda arrays: np.deg2rad(arrays["a"], out=arrays["_out"]),
+    "rad2deg": lambda arrays: np.rad2deg(arrays["a"], out=arrays["_out"]),
+
+    # Bitwise operations
+    "bitwise_and": lambda arrays: np.bitwise_and(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "bitwise_or": lambda arrays: np.bitwise_or(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "bitwise_xor": lambda arrays: np.bitwise_xor(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "bitwise_not": lambda arrays: np.bitwise_not(arrays["a"], out=arrays["_out"]),
+    "invert": lambda arrays: np.invert(arrays["a"], out=arrays["_out"]),
+    "left_shift": lambda arrays: np.left_shift(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "right_shift": lambda arrays: np.right_shift(arrays["a"], arrays["b"], out=arrays["_out"]),
+
+    # Linear algebra
+    "dot": lambda arrays: np.dot(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "outer": lambda arrays: np.outer(arrays["a"], arrays["b"], out=arrays["_out"]),
+    "matmul": lambda arrays: np.matmul(arrays["a"], arrays["b"], out=arrays["_out"]),
+
+}
+
+# Reductions also take out= (when reducing along an axis); see bind_reduction
+REDUCTION_OPS = frozenset(
+    ("sum", "mean", "max", "min", "prod", "argmin", "argmax", "var", "std", "all", "any")
+)
+
+
+def bind_reduction(
+    operation: str, axis: Any, out: np.ndarray = None
+) -> Callable[[Dict[str, Any]], Any]:
+    """Reduction callable with its axis (and out buffer) resolved up front"""
+    method = getattr(np.ndarray, operation)
+    if out is None:
+        return lambda arrays: method(arrays["a"], axis=axis)
+    return lambda arrays: method(arrays["a"], axis=axis, out=out)
+
+
+def with_preallocated_output(
+    operation: str, fn: Callable[[Dict[str, Any]], Any], arrays: Dict[str, Any]
+) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Swap fn for its out= variant, allocating arrays["_out"] to match
+
+    The buffer's shape and dtype come from one call of the allocating
+    version. Returns fn unchanged when the op has no out= variant or the
+    result isn't an array (e.g. a full reduction to a scalar).
+    """
+    if operation in REDUCTION_OPS:
+        if arrays.get("axis") is None:
+            return fn
+    elif operation not in OUT_OPS:
+        return fn
+
+    result = fn(arrays)
+    if not isinstance(result, np.ndarray) or result.ndim == 0:
+        return fn
+    arrays["_out"] = np.empty_like(result, order="C")
+    if operation in REDUCTION_OPS:
+        return bind_reduction(operation, arrays["axis"], arrays["_out"])
+    return OUT_OPS[operation]
+
+
+def get_operation(operation: str, axis: Any = None) -> Callable[[Dict[str, Any]], Any]:
+    """Resolve an operation name (and a reduction's axis) to its benchmark callable"""
+    if operation in REDUCTION_OPS:
+        return bind_reduction(operation, axis)
+    try:
+        return OPS[operation]
+    except KeyError:
+        raise ValueError(f"Unknown operation: {operation}") from None
 
 
 def calibrate_ops_per_sample(
-    operation: str,
+    fn: Callable[[Dict[str, Any]], Any],
     arrays: Dict[str, np.ndarray],
-    target_time_ms: float = MIN_SAMPLE_TIME_MS,
+    target_time_ms: float = None,
 ) -> int:
     """
     Auto-calibrate: Determine how many operations to run per sample
     to achieve the target minimum sample time
+
+    Times one call, then a short probe batch sized to take roughly
+    CALIBRATION_PROBE_NS, and derives the batch size in closed form instead
+    of growing it geometrically (which could overshoot the target ~10x).
     """
-    ops_per_sample = 1
-    calibration_runs = 0
-    max_calibration_runs = 10
+    if target_time_ms is None:
+        target_time_ms = MIN_SAMPLE_TIME_MS
+    # Integer nanoseconds keep sub-microsecond timings exact
+    target_ns = int(target_time_ms * 1_000_000)
+
+    pc = time.perf_counter_ns
+
+    start = pc()
+    result = fn(arrays)  # Keep the result alive until the next call
+    single_ns = max(1, pc() - start)
+
+    # A single call can be dominated by timer resolution for cheap ops, so
+    # re-measure over enough calls to fill the probe window
+    probe_ops = max(1, min(MAX_PROBE_OPS, CALIBRATION_PROBE_NS // single_ns))
+    if probe_ops > 1:
+        start = pc()
+        for _ in range(probe_ops):
+            result = fn(arrays)  # Keep the result alive until the next call
+        probe_ns = max(1, pc() - start)
+    else:
+        probe_ns = single_ns
 
-    while calibration_runs < max_calibration_runs:
-        start = time.perf_counter()
+    # Integer ceil of target_ns / time_per_op
+    ops_per_sample = (target_ns * probe_ops + probe_ns - 1) // probe_ns
+
+    # Cap at reasonable maximum to prevent too-long samples
+    return max(1, min(ops_per_sample, MAX_OPS_PER_SAMPLE))
 
-        # Run operations in batch
+
+def measure_loop_overhead_ns(ops_per_sample: int, repeats: int = 3) -> int:
+    """
+    Time the bare batch loop (no operation) for ops_per_sample iterations
+
+    Subtracted from each sample for the corrected_* result fields, which show
+    how much of a sub-microsecond op's time is Python's loop and timer cost.
+    Best of a few runs, since noise only ever adds time.
+    """
+    pc = time.perf_counter_ns
+    best = None
+    for _ in range(repeats):
+        start = pc()
         for _ in range(ops_per_sample):
-            result = execute_operation(operation, arrays)
-            _ = result  # Prevent optimization
+            pass
+        elapsed_ns = pc() - start
+        best = elapsed_ns if best is None else min(best, elapsed_ns)
+    return best
 
-        elapsed_ms = (time.perf_counter() - start) * 1000
 
-        # If we hit the target time, we're done
-        if elapsed_ms >= target_time_ms:
-            break
+def summarize_samples(samples: List[float]) -> Tuple[float, float, float, float, float]:
+    """
+    Mean, median, min, max and population std of a handful of samples
 
-        # If operation is very fast, increase ops exponentially
-        if elapsed_ms < target_time_ms / 10:
-            ops_per_sample *= 10
-        elif elapsed_ms < target_time_ms / 2:
-            ops_per_sample *= 2
-        else:
-            # Close enough, calculate exact number needed
-            target_ops = int(np.ceil((ops_per_sample * target_time_ms) / elapsed_ms))
-            ops_per_sample = max(target_ops, ops_per_sample + 1)
-            break
+    Plain Python on purpose: NumPy's per-call overhead would dwarf the math
+    for a list this short.
+    """
+    n = len(samples)
+    ordered = sorted(samples)
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
 
-        calibration_runs += 1
+    # Welford's single pass for the variance; fmean gives the exactly
+    # rounded mean that ops_per_sec is derived from
+    welford_mean = 0.0
+    m2 = 0.0
+    for i, x in enumerate(samples, 1):
+        delta = x - welford_mean
+        welford_mean += delta / i
+        m2 += delta * (x - welford_mean)
 
-    # Cap at reasonable maximum to prevent too-long samples
-    max_ops_per_sample = 100000
-    return min(ops_per_sample, max_ops_per_sample)
+    return statistics.fmean(samples), median, ordered[0], ordered[-1], math.sqrt(m2 / n)
 
 
-def run_benchmark(spec: Dict[str, Any]) -> Dict[str, Any]:
+def run_benchmark(spec: Spec) -> Dict[str, Any]:
     """Run a single benchmark with auto-calibration and return timing results"""
-    name = spec["name"]
-    operation = spec["operation"]
-    setup = spec["setup"]
-    warmup = spec["warmup"]
+    name = spec.name
+    operation = spec.operation
+    setup = spec.setup
+    warmup = spec.warmup
 
     # Setup arrays (pass operation for IO benchmarks that need pre-serialized data)
     arrays = setup_arrays(setup, operation)
 
+    # Resolve the operation once so the timed loops skip name dispatch
+    fn = get_operation(operation, arrays.get("axis"))
+    if spec.backend == "numba":
+        generic = numba_kernel(operation)
+        if generic is not None:
+            fn = specialized_kernel(operation, arrays) or generic
+            # At least one warmup call so JIT compilation is never timed
+            warmup = max(warmup, 1)
+        else:
+            print(
+                f"  Numba backend unavailable for {name}, using NumPy",
+                file=sys.stderr,
+            )
+    elif PREALLOCATE_OUTPUTS:
+        fn = with_preallocated_output(operation, fn, arrays)
+
     # Warmup phase - run several times to stabilize JIT/caching
     for _ in range(warmup):
-        execute_operation(operation, arrays)
+        fn(arrays)
 
     # Calibration phase - determine ops per sample
-    ops_per_sample = calibrate_ops_per_sample(operation, arrays)
+    ops_per_sample = calibrate_ops_per_sample(fn, arrays)
+    overhead_ns = measure_loop_overhead_ns(ops_per_sample)
 
     # Benchmark phase - collect samples
     sample_times = []
+    corrected_sample_times = []
     total_ops = 0
+    pc = time.perf_counter_ns
 
     for _ in range(TARGET_SAMPLES):
-        start = time.perf_counter()
+        start = pc()
 
         # Run batch of operations
         for _ in range(ops_per_sample):
-            result = execute_operation(operation, arrays)
-            _ = result  # Prevent optimization
+            result = fn(arrays)  # Keep the result alive until the next call
 
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        time_per_op = elapsed_ms / ops_per_sample
-        sample_times.append(time_per_op)
+        elapsed_ns = pc() - start
+        sample_times.append(elapsed_ns / 1e6 / ops_per_sample)
+        # Floor at 1ns so timer noise can't produce a non-positive time
+        corrected_sample_times.append(
+            max(1, elapsed_ns - overhead_ns) / 1e6 / ops_per_sample
+        )
         total_ops += ops_per_sample
 
-    # Calculate statistics
-    times_array = np.array(sample_times)
-    mean_ms = float(np.mean(times_array))
-    median_ms = float(np.median(times_array))
-    min_ms = float(np.min(times_array))
-    max_ms = float(np.max(times_array))
-    std_ms = float(np.std(times_array))
+    # Calculate statistics. The headline fields include loop overhead, like
+    # the numpy-ts runner's timings they are compared against; the corrected
+    # fields subtract it and are informational only.
+    mean_ms, median_ms, min_ms, max_ms, std_ms = summarize_samples(sample_times)
     ops_per_sec = 1000.0 / mean_ms
+    corrected_mean_ms, corrected_median_ms, _, _, _ = summarize_samples(
+        corrected_sample_times
+    )
 
     return {
         "name": name,
@@ -506,16 +801,88 @@ def run_benchmark(spec: Dict[str, Any]) -> Dict[str, Any]:
         "ops_per_sec": ops_per_sec,
         "total_ops": total_ops,
         "total_samples": TARGET_SAMPLES,
+        "corrected_mean_ms": corrected_mean_ms,
+        "corrected_median_ms": corrected_median_ms,
+        "corrected_ops_per_sec": 1000.0 / corrected_mean_ms,
+        "loop_overhead_ns": overhead_ns / ops_per_sample,
     }
 
 
+def loads(data: bytes) -> Any:
+    """Parse JSON, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to compact JSON, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _init_worker(
+    min_sample_time_ms: float, target_samples: int, preallocate_outputs: bool
+) -> None:
+    """Apply the stdin config inside a freshly spawned worker process"""
+    global MIN_SAMPLE_TIME_MS, TARGET_SAMPLES, PREALLOCATE_OUTPUTS
+    MIN_SAMPLE_TIME_MS = min_sample_time_ms
+    TARGET_SAMPLES = target_samples
+    PREALLOCATE_OUTPUTS = preallocate_outputs
+
+
+def run_benchmarks(
+    specs: List[Spec], workers: int = 1
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Run all benchmarks, yielding (spec index, result) as each one finishes
+
+    With workers > 1, independent benchmarks are spread over a process pool
+    whose workers are pinned to one BLAS thread so they don't oversubscribe
+    cores. BLAS-dominated ops still run sequentially in this process with the
+    full thread pool. Results are yielded in completion order.
+    """
+    if workers <= 1:
+        for i, spec in enumerate(specs):
+            yield i, run_benchmark(spec)
+        return
+
+    parallel = [i for i, spec in enumerate(specs) if spec.operation not in BLAS_OPS]
+    sequential = [i for i, spec in enumerate(specs) if spec.operation in BLAS_OPS]
+
+    # Spawned workers read these at NumPy import; this process' BLAS is
+    # already initialized and unaffected
+    saved_env = {var: os.environ.get(var) for var in BLAS_THREAD_VARS}
+    os.environ.update({var: "1" for var in BLAS_THREAD_VARS})
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(MIN_SAMPLE_TIME_MS, TARGET_SAMPLES, PREALLOCATE_OUTPUTS),
+        ) as executor:
+            futures = {executor.submit(run_benchmark, specs[i]): i for i in parallel}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    finally:
+        for var, value in saved_env.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+    for i in sequential:
+        yield i, run_benchmark(specs[i])
+
+
 def main():
-    """Main entry point - read specs and config from stdin, output results to stdout"""
-    global MIN_SAMPLE_TIME_MS, TARGET_SAMPLES
+    """Main entry point - read specs and config from stdin, stream results to stdout"""
+    global MIN_SAMPLE_TIME_MS, TARGET_SAMPLES, PREALLOCATE_OUTPUTS
 
     try:
         # Read benchmark specifications and config from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = loads(sys.stdin.buffer.read())
 
         # Support both old format (just specs) and new format (specs + config)
         if isinstance(input_data, dict) and "specs" in input_data:
@@ -523,11 +890,23 @@ def main():
             config = input_data.get("config", {})
             MIN_SAMPLE_TIME_MS = config.get("minSampleTimeMs", MIN_SAMPLE_TIME_MS)
             TARGET_SAMPLES = config.get("targetSamples", TARGET_SAMPLES)
+            PREALLOCATE_OUTPUTS = config.get("preallocateOutputs", PREALLOCATE_OUTPUTS)
         else:
             # Old format - just specs array
             specs = input_data
+            config = {}
+
+        specs = [Spec.from_dict(raw) for raw in specs]
 
-        results = []
+        workers = config.get("workers", 1)
+        # Struct-of-arrays mode: one {field: [values...]} object at the end
+        # instead of one record per line
+        soa = config.get("soa", False)
+        columns: Dict[str, List[Any]] = {}
+        # Results finished ahead of an earlier spec (parallel runs only),
+        # held back so output order always matches spec order
+        pending = {}
+        next_index = 0
 
         # Print environment info to stderr
         print(f"Python {sys.version.split()[0]}", file=sys.stderr)
@@ -540,21 +919,31 @@ def main():
             file=sys.stderr,
         )
 
-        for i, spec in enumerate(specs, 1):
-            result = run_benchmark(spec)
-            results.append(result)
+        for done, (index, result) in enumerate(run_benchmarks(specs, workers), 1):
+            pending[index] = result
 
             # Print progress to stderr (matching TypeScript format)
-            name_padded = spec["name"].ljust(40)
+            name_padded = specs[index].name.ljust(40)
             mean_padded = f"{result['mean_ms']:.3f}".rjust(8)
             ops_formatted = f"{int(result['ops_per_sec']):,}".rjust(12)
             print(
-                f"  [{i}/{len(specs)}] {name_padded} {mean_padded}ms  {ops_formatted} ops/sec",
+                f"  [{done}/{len(specs)}] {name_padded} {mean_padded}ms  {ops_formatted} ops/sec",
                 file=sys.stderr,
             )
 
-        # Output results as JSON to stdout
-        print(json.dumps(results, indent=2))
+            # Stream results to stdout as JSON lines, in spec order
+            while next_index in pending:
+                ready = pending.pop(next_index)
+                next_index += 1
+                if soa:
+                    for field, value in ready.items():
+                        columns.setdefault(field, []).append(value)
+                    continue
+                sys.stdout.write(dumps(ready) + "\n")
+                sys.stdout.flush()
+
+        if soa:
+            sys.stdout.write(dumps(columns) + "\n")
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
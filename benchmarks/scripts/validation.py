@@ -5,9 +5,48 @@ Runs operations with NumPy and returns results for comparison
 """
 
 import json
+import math
 import sys
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+# Dtypes orjson serializes to exactly what .tolist() + json would produce.
+# float32/float16 are excluded: orjson writes their shortest float32 repr,
+# which would drift from the float64-widened values numpy-ts compares against.
+ORJSON_NATIVE_DTYPES = frozenset(
+    np.dtype(t)
+    for t in ("float64", "int8", "int16", "int32", "int64",
+              "uint8", "uint16", "uint32", "uint64", "bool")
+)
+
+
+def loads(data):
+    """Parse JSON from str or bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Serialize to a JSON string, passing ndarrays through natively with orjson"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(obj)
+
+
+def orjson_can_serialize(arr):
+    """Whether an array can skip the .tolist() round-trip under orjson"""
+    if orjson is None or arr.ndim == 0 or arr.dtype not in ORJSON_NATIVE_DTYPES:
+        return False
+    # orjson writes NaN/Inf as null; those need the sentinel strings instead
+    return arr.dtype.kind != "f" or bool(np.isfinite(arr).all())
+
 
 def setup_arrays(setup_config):
     """Create NumPy arrays from setup configuration"""
@@ -49,317 +88,206 @@ def setup_arrays(setup_config):
         elif fill == "ones":
             arrays[key] = np.ones(shape, dtype=np_dtype)
         elif fill in ["random", "arange"]:
-            size = np.prod(shape)
-            flat = np.arange(0, size, 1, dtype=np_dtype)
-            arrays[key] = flat.reshape(shape)
+            size = math.prod(shape)
+            arrays[key] = np.arange(0, size, 1, dtype=np_dtype).reshape(shape)
 
     return arrays
 
 
-def run_operation(spec):
-    """Run a single operation and return result"""
-    arrays = setup_arrays(spec["setup"])
-    operation = spec["operation"]
-
-    # Execute operation
-    if operation == "zeros":
-        result = np.zeros(arrays["shape"])
-    elif operation == "ones":
-        result = np.ones(arrays["shape"])
-    elif operation == "arange":
-        result = np.arange(0, arrays["n"])
-    elif operation == "linspace":
-        result = np.linspace(0, 100, arrays["n"])
-    elif operation == "logspace":
-        result = np.logspace(0, 3, arrays["n"])
-    elif operation == "geomspace":
-        result = np.geomspace(1, 1000, arrays["n"])
-    elif operation == "eye":
-        result = np.eye(arrays["n"])
-    elif operation == "identity":
-        result = np.identity(arrays["n"])
-    elif operation == "empty":
-        result = np.empty(arrays["shape"])
-        # For empty, just return zeros (we can't compare uninitialized data)
-        result = np.zeros(arrays["shape"])
-    elif operation == "full":
-        result = np.full(arrays["shape"], arrays["fill_value"])
-    elif operation == "copy":
-        result = arrays["a"].copy()
-    elif operation == "zeros_like":
-        result = np.zeros_like(arrays["a"])
-
+def _operand(arrays):
+    """Second operand for binary ops: array "b" if present, else the scalar"""
+    return arrays.get("b") if "b" in arrays else arrays.get("scalar")
+
+
+# Operation name -> callable taking the setup arrays, built once at import
+OPS = {
+    "zeros": lambda arrays: np.zeros(arrays["shape"]),
+    "ones": lambda arrays: np.ones(arrays["shape"]),
+    "arange": lambda arrays: np.arange(0, arrays["n"]),
+    "linspace": lambda arrays: np.linspace(0, 100, arrays["n"]),
+    "logspace": lambda arrays: np.logspace(0, 3, arrays["n"]),
+    "geomspace": lambda arrays: np.geomspace(1, 1000, arrays["n"]),
+    "eye": lambda arrays: np.eye(arrays["n"]),
+    "identity": lambda arrays: np.identity(arrays["n"]),
+    "empty": lambda arrays: np.zeros(arrays["shape"]),  # Uninitialized data can't be compared
+    "full": lambda arrays: np.full(arrays["shape"], arrays["fill_value"]),
+    "copy": lambda arrays: arrays["a"].copy(),
+    "zeros_like": lambda arrays: np.zeros_like(arrays["a"]),
     # Arithmetic
-    elif operation == "add":
-        result = arrays["a"] + (
-            arrays.get("b") if "b" in arrays else arrays.get("scalar")
-        )
-    elif operation == "multiply":
-        result = arrays["a"] * (
-            arrays.get("b") if "b" in arrays else arrays.get("scalar")
-        )
-    elif operation == "mod":
-        divisor = arrays.get("b") if "b" in arrays else arrays.get("scalar")
-        result = np.mod(arrays["a"], divisor)
-    elif operation == "floor_divide":
-        divisor = arrays.get("b") if "b" in arrays else arrays.get("scalar")
-        result = np.floor_divide(arrays["a"], divisor)
-    elif operation == "reciprocal":
-        result = np.reciprocal(arrays["a"])
-    elif operation == "cbrt":
-        result = np.cbrt(arrays["a"])
-    elif operation == "fabs":
-        result = np.fabs(arrays["a"])
-    elif operation == "divmod":
-        divisor = arrays.get("b") if "b" in arrays else arrays.get("scalar")
-        q, r = np.divmod(arrays["a"], divisor)
-        result = q  # Just return quotient for validation
+    "add": lambda arrays: arrays["a"] + _operand(arrays),
+    "multiply": lambda arrays: arrays["a"] * _operand(arrays),
+    "mod": lambda arrays: np.mod(arrays["a"], _operand(arrays)),
+    "floor_divide": lambda arrays: np.floor_divide(arrays["a"], _operand(arrays)),
+    "reciprocal": lambda arrays: np.reciprocal(arrays["a"]),
+    "cbrt": lambda arrays: np.cbrt(arrays["a"]),
+    "fabs": lambda arrays: np.fabs(arrays["a"]),
+    "divmod": lambda arrays: np.divmod(arrays["a"], _operand(arrays))[0],  # Just return quotient for validation
 
     # Math
-    elif operation == "sqrt":
-        result = np.sqrt(arrays["a"])
-    elif operation == "power":
-        result = np.power(arrays["a"], 2)
-    elif operation == "absolute":
-        result = np.absolute(arrays["a"])
-    elif operation == "negative":
-        result = np.negative(arrays["a"])
-    elif operation == "sign":
-        result = np.sign(arrays["a"])
+    "sqrt": lambda arrays: np.sqrt(arrays["a"]),
+    "power": lambda arrays: np.power(arrays["a"], 2),
+    "absolute": lambda arrays: np.absolute(arrays["a"]),
+    "negative": lambda arrays: np.negative(arrays["a"]),
+    "sign": lambda arrays: np.sign(arrays["a"]),
 
     # Trigonometric
-    elif operation == "sin":
-        result = np.sin(arrays["a"])
-    elif operation == "cos":
-        result = np.cos(arrays["a"])
-    elif operation == "tan":
-        result = np.tan(arrays["a"])
-    elif operation == "arctan2":
-        result = np.arctan2(arrays["a"], arrays["b"])
-    elif operation == "hypot":
-        result = np.hypot(arrays["a"], arrays["b"])
+    "sin": lambda arrays: np.sin(arrays["a"]),
+    "cos": lambda arrays: np.cos(arrays["a"]),
+    "tan": lambda arrays: np.tan(arrays["a"]),
+    "arctan2": lambda arrays: np.arctan2(arrays["a"], arrays["b"]),
+    "hypot": lambda arrays: np.hypot(arrays["a"], arrays["b"]),
 
     # Hyperbolic
-    elif operation == "sinh":
-        result = np.sinh(arrays["a"])
-    elif operation == "cosh":
-        result = np.cosh(arrays["a"])
-    elif operation == "tanh":
-        result = np.tanh(arrays["a"])
+    "sinh": lambda arrays: np.sinh(arrays["a"]),
+    "cosh": lambda arrays: np.cosh(arrays["a"]),
+    "tanh": lambda arrays: np.tanh(arrays["a"]),
 
     # Linalg
-    elif operation == "dot":
-        result = np.dot(arrays["a"], arrays["b"])
-    elif operation == "inner":
-        result = np.inner(arrays["a"], arrays["b"])
-    elif operation == "outer":
-        result = np.outer(arrays["a"], arrays["b"])
-    elif operation == "matmul":
-        result = arrays["a"] @ arrays["b"]
-    elif operation == "trace":
-        result = np.trace(arrays["a"])
-    elif operation == "transpose":
-        result = arrays["a"].T
-    elif operation == "diagonal":
-        result = np.diagonal(arrays["a"])
-    elif operation == "kron":
-        result = np.kron(arrays["a"], arrays["b"])
-    elif operation == "einsum":
-        result = np.einsum(arrays["subscripts"], arrays["a"], arrays["b"])
-    elif operation == "deg2rad":
-        result = np.deg2rad(arrays["a"])
-    elif operation == "rad2deg":
-        result = np.rad2deg(arrays["a"])
+    "dot": lambda arrays: np.dot(arrays["a"], arrays["b"]),
+    "inner": lambda arrays: np.inner(arrays["a"], arrays["b"]),
+    "outer": lambda arrays: np.outer(arrays["a"], arrays["b"]),
+    "matmul": lambda arrays: arrays["a"] @ arrays["b"],
+    "trace": lambda arrays: np.trace(arrays["a"]),
+    "transpose": lambda arrays: arrays["a"].T,
+    "diagonal": lambda arrays: np.diagonal(arrays["a"]),
+    "kron": lambda arrays: np.kron(arrays["a"], arrays["b"]),
+    "einsum": lambda arrays: np.einsum(arrays["subscripts"], arrays["a"], arrays["b"]),
+    "deg2rad": lambda arrays: np.deg2rad(arrays["a"]),
+    "rad2deg": lambda arrays: np.rad2deg(arrays["a"]),
 
     # Reductions
-    elif operation == "sum":
-        result = arrays["a"].sum(axis=arrays.get("axis"))
-    elif operation == "mean":
-        result = arrays["a"].mean()
-    elif operation == "max":
-        result = arrays["a"].max()
-    elif operation == "min":
-        result = arrays["a"].min()
-    elif operation == "prod":
-        result = arrays["a"].prod()
-    elif operation == "argmin":
-        result = arrays["a"].argmin()
-    elif operation == "argmax":
-        result = arrays["a"].argmax()
-    elif operation == "var":
-        result = arrays["a"].var()
-    elif operation == "std":
-        result = arrays["a"].std()
-    elif operation == "all":
-        result = arrays["a"].all()
-    elif operation == "any":
-        result = arrays["a"].any()
+    "sum": lambda arrays: arrays["a"].sum(axis=arrays.get("axis")),
+    "mean": lambda arrays: arrays["a"].mean(),
+    "max": lambda arrays: arrays["a"].max(),
+    "min": lambda arrays: arrays["a"].min(),
+    "prod": lambda arrays: arrays["a"].prod(),
+    "argmin": lambda arrays: arrays["a"].argmin(),
+    "argmax": lambda arrays: arrays["a"].argmax(),
+    "var": lambda arrays: arrays["a"].var(),
+    "std": lambda arrays: arrays["a"].std(),
+    "all": lambda arrays: arrays["a"].all(),
+    "any": lambda arrays: arrays["a"].any(),
 
     # New reduction functions
-    elif operation == "cumsum":
-        result = arrays["a"].cumsum()
-    elif operation == "cumprod":
-        result = arrays["a"].cumprod()
-    elif operation == "ptp":
-        result = np.ptp(arrays["a"])
-    elif operation == "median":
-        result = np.median(arrays["a"])
-    elif operation == "percentile":
-        result = np.percentile(arrays["a"], 50)
-    elif operation == "quantile":
-        result = np.quantile(arrays["a"], 0.5)
-    elif operation == "average":
-        result = np.average(arrays["a"])
-    elif operation == "nansum":
-        result = np.nansum(arrays["a"])
-    elif operation == "nanmean":
-        result = np.nanmean(arrays["a"])
-    elif operation == "nanmin":
-        result = np.nanmin(arrays["a"])
-    elif operation == "nanmax":
-        result = np.nanmax(arrays["a"])
+    "cumsum": lambda arrays: arrays["a"].cumsum(),
+    "cumprod": lambda arrays: arrays["a"].cumprod(),
+    "ptp": lambda arrays: np.ptp(arrays["a"]),
+    "median": lambda arrays: np.median(arrays["a"]),
+    "percentile": lambda arrays: np.percentile(arrays["a"], 50),
+    "quantile": lambda arrays: np.quantile(arrays["a"], 0.5),
+    "average": lambda arrays: np.average(arrays["a"]),
+    "nansum": lambda arrays: np.nansum(arrays["a"]),
+    "nanmean": lambda arrays: np.nanmean(arrays["a"]),
+    "nanmin": lambda arrays: np.nanmin(arrays["a"]),
+    "nanmax": lambda arrays: np.nanmax(arrays["a"]),
 
     # Reshape
-    elif operation == "reshape":
-        result = arrays["a"].reshape(*arrays["new_shape"])
-    elif operation == "flatten":
-        result = arrays["a"].flatten()
-    elif operation == "ravel":
-        result = arrays["a"].ravel()
+    "reshape": lambda arrays: arrays["a"].reshape(*arrays["new_shape"]),
+    "flatten": lambda arrays: arrays["a"].flatten(),
+    "ravel": lambda arrays: arrays["a"].ravel(),
 
     # Array manipulation
-    elif operation == "swapaxes":
-        result = np.swapaxes(arrays["a"], 0, 1)
-    elif operation == "concatenate":
-        result = np.concatenate([arrays["a"], arrays["b"]], axis=0)
-    elif operation == "stack":
-        result = np.stack([arrays["a"], arrays["b"]], axis=0)
-    elif operation == "vstack":
-        result = np.vstack([arrays["a"], arrays["b"]])
-    elif operation == "hstack":
-        result = np.hstack([arrays["a"], arrays["b"]])
-    elif operation == "tile":
-        result = np.tile(arrays["a"], [2, 2])
-    elif operation == "repeat":
-        result = np.repeat(arrays["a"], 2)
+    "swapaxes": lambda arrays: np.swapaxes(arrays["a"], 0, 1),
+    "concatenate": lambda arrays: np.concatenate([arrays["a"], arrays["b"]], axis=0),
+    "stack": lambda arrays: np.stack([arrays["a"], arrays["b"]], axis=0),
+    "vstack": lambda arrays: np.vstack([arrays["a"], arrays["b"]]),
+    "hstack": lambda arrays: np.hstack([arrays["a"], arrays["b"]]),
+    "tile": lambda arrays: np.tile(arrays["a"], [2, 2]),
+    "repeat": lambda arrays: np.repeat(arrays["a"], 2),
 
     # Advanced
-    elif operation == "broadcast_to":
-        result = np.broadcast_to(arrays["a"], arrays["target_shape"])
-    elif operation == "take":
-        result = np.take(arrays["a"], arrays["indices"])
+    "broadcast_to": lambda arrays: np.broadcast_to(arrays["a"], arrays["target_shape"]),
+    "take": lambda arrays: np.take(arrays["a"], arrays["indices"]),
 
     # New creation functions
-    elif operation == "diag":
-        result = np.diag(arrays["a"])
-    elif operation == "tri":
-        result = np.tri(arrays["shape"][0], arrays["shape"][1])
-    elif operation == "tril":
-        result = np.tril(arrays["a"])
-    elif operation == "triu":
-        result = np.triu(arrays["a"])
+    "diag": lambda arrays: np.diag(arrays["a"]),
+    "tri": lambda arrays: np.tri(arrays["shape"][0], arrays["shape"][1]),
+    "tril": lambda arrays: np.tril(arrays["a"]),
+    "triu": lambda arrays: np.triu(arrays["a"]),
 
     # New manipulation functions
-    elif operation == "flip":
-        result = np.flip(arrays["a"])
-    elif operation == "rot90":
-        result = np.rot90(arrays["a"])
-    elif operation == "roll":
-        result = np.roll(arrays["a"], 10)
-    elif operation == "pad":
-        result = np.pad(arrays["a"], 2)
+    "flip": lambda arrays: np.flip(arrays["a"]),
+    "rot90": lambda arrays: np.rot90(arrays["a"]),
+    "roll": lambda arrays: np.roll(arrays["a"], 10),
+    "pad": lambda arrays: np.pad(arrays["a"], 2),
 
     # Indexing functions
-    elif operation == "take_along_axis":
-        result = np.take_along_axis(arrays["a"], arrays["b"].astype(np.intp), axis=0)
-    elif operation == "compress":
-        result = np.compress(arrays["b"].astype(bool), arrays["a"], axis=0)
-    elif operation == "diag_indices":
-        idx = np.diag_indices(arrays["n"])
-        # Stack them for comparison
-        result = np.stack([idx[0], idx[1]], axis=0)
-    elif operation == "tril_indices":
-        idx = np.tril_indices(arrays["n"])
-        result = np.stack([idx[0], idx[1]], axis=0)
-    elif operation == "triu_indices":
-        idx = np.triu_indices(arrays["n"])
-        result = np.stack([idx[0], idx[1]], axis=0)
-    elif operation == "indices":
-        result = np.indices(tuple(arrays["shape"]))
-    elif operation == "ravel_multi_index":
-        result = np.ravel_multi_index((arrays["a"].astype(np.intp).ravel(), arrays["b"].astype(np.intp).ravel()), tuple(arrays["dims"]))
-    elif operation == "unravel_index":
-        idx = np.unravel_index(arrays["a"].astype(np.intp).ravel(), tuple(arrays["dims"]))
-        result = np.stack([np.array(i) for i in idx], axis=0)
+    "take_along_axis": lambda arrays: np.take_along_axis(arrays["a"], arrays["b"].astype(np.intp), axis=0),
+    "compress": lambda arrays: np.compress(arrays["b"].astype(bool), arrays["a"], axis=0),
+    "diag_indices": lambda arrays: np.stack(np.diag_indices(arrays["n"]), axis=0),
+    "tril_indices": lambda arrays: np.stack(np.tril_indices(arrays["n"]), axis=0),
+    "triu_indices": lambda arrays: np.stack(np.triu_indices(arrays["n"]), axis=0),
+    "indices": lambda arrays: np.indices(tuple(arrays["shape"])),
+    "ravel_multi_index": lambda arrays: np.ravel_multi_index((arrays["a"].astype(np.intp).ravel(), arrays["b"].astype(np.intp).ravel()), tuple(arrays["dims"])),
+    "unravel_index": lambda arrays: np.stack(np.unravel_index(arrays["a"].astype(np.intp).ravel(), tuple(arrays["dims"])), axis=0),
 
     # Bitwise operations
-    elif operation == "bitwise_and":
-        result = np.bitwise_and(arrays["a"], arrays["b"])
-    elif operation == "bitwise_or":
-        result = np.bitwise_or(arrays["a"], arrays["b"])
-    elif operation == "bitwise_xor":
-        result = np.bitwise_xor(arrays["a"], arrays["b"])
-    elif operation == "bitwise_not":
-        result = np.bitwise_not(arrays["a"])
-    elif operation == "invert":
-        result = np.invert(arrays["a"])
-    elif operation == "left_shift":
-        shift = arrays.get("b") if "b" in arrays else 2
-        result = np.left_shift(arrays["a"], shift)
-    elif operation == "right_shift":
-        shift = arrays.get("b") if "b" in arrays else 2
-        result = np.right_shift(arrays["a"], shift)
-    elif operation == "packbits":
-        result = np.packbits(arrays["a"].astype(np.uint8))
-    elif operation == "unpackbits":
-        result = np.unpackbits(arrays["a"].astype(np.uint8))
+    "bitwise_and": lambda arrays: np.bitwise_and(arrays["a"], arrays["b"]),
+    "bitwise_or": lambda arrays: np.bitwise_or(arrays["a"], arrays["b"]),
+    "bitwise_xor": lambda arrays: np.bitwise_xor(arrays["a"], arrays["b"]),
+    "bitwise_not": lambda arrays: np.bitwise_not(arrays["a"]),
+    "invert": lambda arrays: np.invert(arrays["a"]),
+    "left_shift": lambda arrays: np.left_shift(arrays["a"], arrays["b"] if "b" in arrays else 2),
+    "right_shift": lambda arrays: np.right_shift(arrays["a"], arrays["b"] if "b" in arrays else 2),
+    "packbits": lambda arrays: np.packbits(arrays["a"].astype(np.uint8)),
+    "unpackbits": lambda arrays: np.unpackbits(arrays["a"].astype(np.uint8)),
 
     # Sorting operations
-    elif operation == "sort":
-        result = np.sort(arrays["a"])
-    elif operation == "argsort":
-        result = np.argsort(arrays["a"])
-    elif operation == "partition":
-        kth = arrays.get("kth", 0)
-        result = np.partition(arrays["a"], kth)
-    elif operation == "argpartition":
-        kth = arrays.get("kth", 0)
-        result = np.argpartition(arrays["a"], kth)
-    elif operation == "lexsort":
-        result = np.lexsort((arrays["a"].ravel(), arrays["b"].ravel()))
-    elif operation == "sort_complex":
-        result = np.sort_complex(arrays["a"]).real  # Return real part for comparison
+    "sort": lambda arrays: np.sort(arrays["a"]),
+    "argsort": lambda arrays: np.argsort(arrays["a"]),
+    "partition": lambda arrays: np.partition(arrays["a"], arrays.get("kth", 0)),
+    "argpartition": lambda arrays: np.argpartition(arrays["a"], arrays.get("kth", 0)),
+    "lexsort": lambda arrays: np.lexsort((arrays["a"].ravel(), arrays["b"].ravel())),
+    "sort_complex": lambda arrays: np.sort_complex(arrays["a"]).real,  # Return real part for comparison
 
     # Searching operations
-    elif operation == "nonzero":
-        idx = np.nonzero(arrays["a"])
-        result = np.stack(idx, axis=0)
-    elif operation == "flatnonzero":
-        result = np.flatnonzero(arrays["a"])
-    elif operation == "where":
-        result = np.where(arrays["a"], arrays["b"], arrays["c"])
-    elif operation == "searchsorted":
-        result = np.searchsorted(arrays["a"].ravel(), arrays["b"].ravel())
-    elif operation == "extract":
-        result = np.extract(arrays["condition"], arrays["a"])
-    elif operation == "count_nonzero":
-        result = np.count_nonzero(arrays["a"])
+    "nonzero": lambda arrays: np.stack(np.nonzero(arrays["a"]), axis=0),
+    "flatnonzero": lambda arrays: np.flatnonzero(arrays["a"]),
+    "where": lambda arrays: np.where(arrays["a"], arrays["b"], arrays["c"]),
+    "searchsorted": lambda arrays: np.searchsorted(arrays["a"].ravel(), arrays["b"].ravel()),
+    "extract": lambda arrays: np.extract(arrays["condition"], arrays["a"]),
+    "count_nonzero": lambda arrays: np.count_nonzero(arrays["a"]),
+}
 
-    else:
+
+def run_operation(spec):
+    """Run a single operation and return result"""
+    arrays = setup_arrays(spec["setup"])
+    operation = spec["operation"]
+
+    # Execute operation
+    fn = OPS.get(operation)
+    if fn is None:
         raise ValueError(f"Unknown operation: {operation}")
+    result = fn(arrays)
 
-    # Convert result to JSON-serializable format
+    # Convert result to JSON-serializable format (Infinity/NaN as sentinels)
     if isinstance(result, np.ndarray):
-        return {"shape": result.shape, "data": result.tolist()}
+        if orjson_can_serialize(result):
+            # orjson only accepts C-contiguous arrays
+            return {"shape": list(result.shape), "data": np.ascontiguousarray(result)}
+        return {"shape": result.shape, "data": serialize_array(result)}
     elif isinstance(result, (np.integer, np.floating)):
-        return float(result)
+        return serialize_value(float(result))
     elif isinstance(result, np.bool_):
         return bool(result)
     else:
-        return result
+        return serialize_value(result)
 
 
-import math
+def serialize_array(arr):
+    """Convert an array to nested lists, replacing Infinity/NaN with sentinels"""
+    if arr.dtype.kind == "f":
+        finite = np.isfinite(arr)
+        if not finite.all():
+            # Only arrays with non-finite values pay for the object copy
+            out = arr.astype(object)
+            out[np.isnan(arr)] = "__NaN__"
+            out[np.isposinf(arr)] = "__Infinity__"
+            out[np.isneginf(arr)] = "__-Infinity__"
+            return out.tolist()
+    return arr.tolist()
+
 
 def serialize_value(val):
     """Recursively serialize values, handling Infinity and NaN"""
@@ -378,23 +306,20 @@ def serialize_value(val):
 
 def main():
     # Read specs from stdin
-    input_data = json.loads(sys.stdin.read())
+    input_data = loads(sys.stdin.buffer.read())
     specs = input_data["specs"]
 
     results = []
 
     for spec in specs:
         try:
-            result = run_operation(spec)
-            # Serialize to handle Infinity/NaN
-            result = serialize_value(result)
-            results.append(result)
+            results.append(run_operation(spec))
         except Exception as e:
             print(f"Error running {spec['name']}: {e}", file=sys.stderr)
             results.append(None)
 
     # Output results as JSON
-    print(json.dumps(results))
+    print(dumps(results))
 
 
 if __name__ == "__main__":
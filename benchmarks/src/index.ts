@@ -40,6 +40,17 @@ async function main() {
       options.category = args[++i];
     } else if (arg === '--output' && i + 1 < args.length) {
       options.output = args[++i];
+    } else if (arg === '--workers' && i + 1 < args.length) {
+      const workers = parseInt(args[++i], 10);
+      if (!Number.isInteger(workers) || workers < 1) {
+        console.error('❌ --workers expects a positive integer');
+        process.exit(1);
+      }
+      options.workers = workers;
+    } else if (arg === '--preallocate-outputs') {
+      options.preallocateOutputs = true;
+    } else if (arg === '--soa') {
+      options.soa = true;
     } else if (arg === '--help' || arg === '-h') {
       printHelp();
       process.exit(0);
@@ -111,7 +122,10 @@ async function main() {
     const { results: numpyResults, pythonVersion, numpyVersion } = await runPythonBenchmarks(
       specs,
       minSampleTimeMs,
-      targetSamples
+      targetSamples,
+      options.workers,
+      options.preallocateOutputs,
+      options.soa
     );
 
     // Compare results
@@ -198,6 +212,10 @@ Options:
                        Arrays: 10K, 316x316 (~100K), 1000x1000 (1M)
   --category <name>    Run only benchmarks in specified category
   --output <path>      Save JSON results to specified path
+  --workers <n>        Run NumPy benchmarks in <n> processes (BLAS ops stay sequential)
+  --preallocate-outputs
+                       NumPy ops write into a reused out= buffer where supported
+  --soa                Python returns results as one struct-of-arrays object
   --help, -h           Show this help message
 
 Categories:
@@ -215,6 +233,7 @@ Examples:
   npm run bench:large                     # Run large array benchmarks
   npm run bench -- --category linalg      # Run only linalg benchmarks
   npm run bench -- --output out.json      # Standard benchmarks, save to out.json
+  npm run bench -- --workers 4            # Run the NumPy side in 4 processes
 `);
 }
 
@@ -7,10 +7,36 @@ import { spawn } from 'child_process';
 import { resolve } from 'path';
 import type { BenchmarkCase, BenchmarkTiming } from './types';
 
+type TimingColumns = { [K in keyof BenchmarkTiming]: BenchmarkTiming[K][] };
+
+/**
+ * Whether the script emitted a single struct-of-arrays object ("soa" config)
+ */
+function isStructOfArrays(records: any[]): records is [TimingColumns] {
+  return records.length === 1 && Array.isArray(records[0]?.name);
+}
+
+/**
+ * Convert struct-of-arrays output back into one record per benchmark
+ */
+function fromStructOfArrays(columns: TimingColumns): BenchmarkTiming[] {
+  const fields = Object.keys(columns) as (keyof BenchmarkTiming)[];
+  return columns.name.map((_, i) => {
+    const timing: Record<string, unknown> = {};
+    for (const field of fields) {
+      timing[field] = columns[field][i];
+    }
+    return timing as unknown as BenchmarkTiming;
+  });
+}
+
 export async function runPythonBenchmarks(
   specs: BenchmarkCase[],
   minSampleTimeMs: number = 100,
-  targetSamples: number = 5
+  targetSamples: number = 5,
+  workers: number = 1,
+  preallocateOutputs: boolean = false,
+  soa: boolean = false
 ): Promise<{ results: BenchmarkTiming[]; pythonVersion?: string; numpyVersion?: string }> {
   const scriptPath = resolve(__dirname, '../scripts/numpy_benchmark.py');
 
@@ -52,7 +78,14 @@ export async function runPythonBenchmarks(
       }
 
       try {
-        const results = JSON.parse(stdout) as BenchmarkTiming[];
+        // One JSON result per line (JSONL), in spec order
+        const records = stdout
+          .split('\n')
+          .filter((line) => line.trim() !== '')
+          .map((line) => JSON.parse(line));
+        const results = isStructOfArrays(records)
+          ? fromStructOfArrays(records[0])
+          : (records as BenchmarkTiming[]);
         resolve({ results, pythonVersion, numpyVersion });
       } catch (err) {
         reject(new Error(`Failed to parse Python output: ${err}\n${stdout}`));
@@ -70,6 +103,9 @@ export async function runPythonBenchmarks(
         config: {
           minSampleTimeMs,
           targetSamples,
+          workers,
+          preallocateOutputs,
+          soa,
         },
       })
     );
@@ -20,6 +20,7 @@ export interface BenchmarkCase {
   setup: BenchmarkSetup;
   iterations: number;
   warmup: number;
+  backend?: 'numpy' | 'numba'; // Python-side kernel backend (default: numpy)
 }
 
 export interface BenchmarkTiming {
@@ -32,6 +33,12 @@ export interface BenchmarkTiming {
   ops_per_sec: number; // Operations per second
   total_ops: number; // Total operations executed
   total_samples: number; // Number of timing samples taken
+  // NumPy runner only, informational: the timings above include loop
+  // overhead (as numpy-ts's do); these subtract the measured Python loop cost
+  corrected_mean_ms?: number; // Mean excluding loop overhead
+  corrected_median_ms?: number; // Median excluding loop overhead
+  corrected_ops_per_sec?: number; // Ops/sec excluding loop overhead
+  loop_overhead_ns?: number; // Measured loop overhead per operation
 }
 
 export interface BenchmarkComparison {
@@ -68,4 +75,7 @@ export interface BenchmarkOptions {
   mode?: BenchmarkMode;
   category?: string;
   output?: string;
+  workers?: number; // Python process-pool size (1 = sequential)
+  preallocateOutputs?: boolean; // Python ops write into a reused out= buffer
+  soa?: boolean; // Python emits one struct-of-arrays object instead of JSONL
 }
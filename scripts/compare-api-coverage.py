@@ -10,15 +10,59 @@ Usage:
     python scripts/compare-api-coverage.py              # Update README
     python scripts/compare-api-coverage.py --verbose    # Show detailed gaps
     python scripts/compare-api-coverage.py -v           # Short form
+    python scripts/compare-api-coverage.py --force      # Re-run audits
 """
 
 import argparse
+import heapq
 import json
+import pickle
 import re
 import subprocess
 import sys
+from collections import namedtuple
+from functools import lru_cache
+from itertools import chain, dropwhile, takewhile
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+# Read-only name sets shared by the coverage analysis and the verbose gap
+# report; numpy_categories maps each NumPy category to its functions
+ApiSets = namedtuple(
+    'ApiSets',
+    ['numpy_categories', 'numpy_toplevel', 'numpyts_toplevel',
+     'numpy_methods', 'numpyts_methods', 'numpyts_all']
+)
+
+# Last analysis, keyed by the audit JSONs' (mtime_ns, size)
+ANALYSIS_CACHE = Path(__file__).parent / '.coverage-cache.pkl'
+
+# README patterns rewritten by update_readme. Variable parts use negated
+# character classes rather than lazy .*? so each match is a single linear scan.
+# Patterns are UTF-8 bytes: the README is rewritten without decoding it.
+BADGE_RE = re.compile(
+    rb'!\[numpy api coverage\]\(https://img\.shields\.io/badge/numpy_api_coverage-\d+%20%25-\w+\)'
+)
+API_BULLET_RE = re.compile(
+    r'- \*\*📊 Extensive API\*\* — \*\*[^*\n]*\*\*'.encode()
+)
+# Use a more specific pattern to avoid exponential backtracking
+COVERAGE_TABLE_RE = re.compile(
+    rb'### API Coverage\n\n'
+    rb'Progress toward complete NumPy API compatibility:\n\n'
+    rb'(?:\|[^\n]*\n)+'  # Match table rows (non-capturing, possessive)
+    rb'\n?'  # Optional blank line before Overall
+    rb'\*\*Overall:[^\n]*\n'
+)
+ARCH_DIAGRAM_RE = re.compile(
+    r'│  NumPy-Compatible API \([^)\n]*\)   │'.encode()
+)
+COMPARISON_ROW_RE = re.compile(rb'\| NumPy API Coverage \| [^|\n]* \|')
+
 
 def run_audits():
     """Run both audit scripts to generate fresh JSON files."""
@@ -26,216 +70,335 @@ def run_audits():
 
     print("Running audits to generate fresh data...\n")
 
-    # Run NumPy audit
+    # The audits are independent, so start both and then wait on each.
+    # Only stderr is reported, so stdout isn't piped back at all.
     print("1. Auditing NumPy API...")
-    result = subprocess.run(
+    numpy_proc = subprocess.Popen(
         [sys.executable, scripts_dir / 'audit-numpy-api.py'],
         cwd=scripts_dir.parent,
-        capture_output=True,
-        text=True,
-        check=False
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
     )
-    if result.returncode != 0:
-        print(f"Error running NumPy audit:\n{result.stderr}")
-        sys.exit(1)
 
-    # Run numpy-ts audit
     print("2. Auditing numpy-ts API...")
-    result = subprocess.run(
+    numpyts_proc = subprocess.Popen(
         ['npx', 'tsx', scripts_dir / 'audit-numpyts-api.ts'],
         cwd=scripts_dir.parent,
-        capture_output=True,
-        text=True,
-        check=False
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
     )
-    if result.returncode != 0:
-        print(f"Error running numpy-ts audit:\n{result.stderr}")
-        sys.exit(1)
+
+    # Collect both before reporting so a failure doesn't orphan the other
+    results = [
+        (name, proc.communicate()[1], proc.returncode)
+        for name, proc in (('NumPy', numpy_proc), ('numpy-ts', numpyts_proc))
+    ]
+    for name, stderr, returncode in results:
+        if returncode != 0:
+            print(f"Error running {name} audit:\n{stderr}")
+            sys.exit(1)
 
     print("✅ Audits complete\n")
 
 
+def audits_up_to_date():
+    """
+    Whether both audit JSONs are newer than everything they are built from.
+
+    Sources are the two audit scripts and src/**/*.ts. A NumPy upgrade
+    isn't visible here; use --force after one.
+    """
+    scripts_dir = Path(__file__).parent
+    jsons = [scripts_dir / 'numpy-api-audit.json',
+             scripts_dir / 'numpyts-api-audit.json']
+    if not all(p.exists() for p in jsons):
+        return False
+
+    oldest_json = min(p.stat().st_mtime_ns for p in jsons)
+    sources = chain(
+        (scripts_dir / 'audit-numpy-api.py',
+         scripts_dir / 'audit-numpyts-api.ts'),
+        (scripts_dir.parent / 'src').rglob('*.ts')
+    )
+    return all(p.stat().st_mtime_ns <= oldest_json for p in sources)
+
+
+@lru_cache(maxsize=4)
 def load_json(filename):
-    """Load JSON file."""
-    filepath = Path(__file__).parent / filename
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """
+    Load JSON file.
+
+    Parsed once per filename; the returned dict is shared between callers,
+    so treat it as read-only.
+    """
+    data = (Path(__file__).parent / filename).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def build_api_sets(numpy_audit, numpyts_audit):
+    """Build the NumPy and numpy-ts name sets once from the audit data."""
+    numpy_categories = {
+        category: frozenset(funcs)
+        for category, funcs in numpy_audit['categorized'].items()
+    }
+    # ALL NumPy top-level functions (from categorized)
+    numpy_toplevel = frozenset().union(*numpy_categories.values())
+    numpyts_toplevel = frozenset(numpyts_audit['all_functions'])
+    numpyts_methods = frozenset(numpyts_audit['ndarray_methods'])
+
+    return ApiSets(
+        numpy_categories=numpy_categories,
+        numpy_toplevel=numpy_toplevel,
+        numpyts_toplevel=numpyts_toplevel,
+        numpy_methods=frozenset(numpy_audit['ndarray_methods']),
+        numpyts_methods=numpyts_methods,
+        # Union for implementation checks (function OR method)
+        numpyts_all=numpyts_toplevel | numpyts_methods,
+    )
 
 
-def print_verbose_gaps(numpy_audit, numpyts_audit):
-    """Print detailed list of missing and extra functions."""
-    numpy_toplevel = set()
-    for funcs in numpy_audit['categorized'].values():
-        numpy_toplevel.update(funcs)
+def _by_pct_desc(item):
+    """Sort key for (category, stats) items: most complete first, then name."""
+    category, stats = item
+    return (-stats['percentage'], category)
 
-    numpyts_toplevel = set(numpyts_audit['all_functions'].keys())
-    numpy_methods = set(numpy_audit['ndarray_methods'].keys())
-    numpyts_methods = set(numpyts_audit['ndarray_methods'].keys())
 
-    print("\n" + "=" * 70)
-    print("VERBOSE GAP ANALYSIS")
-    print("=" * 70)
+def _render_section(heading, names):
+    """Render a gap-list heading followed by its sorted, numbered names."""
+    fmt = "    {:3d}. {}".format
+    return "\n".join(chain(
+        (heading,),
+        (fmt(i, name) for i, name in enumerate(sorted(names), 1))
+    ))
+
+
+def print_verbose_gaps(sets):
+    """Print detailed list of missing and extra functions."""
+    numpy_toplevel = sets.numpy_toplevel
+    numpyts_toplevel = sets.numpyts_toplevel
+    numpy_methods = sets.numpy_methods
+    numpyts_methods = sets.numpyts_methods
+
+    # Hundreds of lines; build the report and write it once
+    parts = ["", "=" * 70, "VERBOSE GAP ANALYSIS", "=" * 70]
 
     # Top-level function gaps
     missing_toplevel = numpy_toplevel - numpyts_toplevel
     extra_toplevel = numpyts_toplevel - numpy_toplevel
 
-    print("\nTOP-LEVEL FUNCTIONS:")
-    print(f"  Missing from numpy-ts ({len(missing_toplevel)}):")
-    for i, func in enumerate(sorted(missing_toplevel), 1):
-        print(f"    {i:3d}. {func}")
+    parts.append("\nTOP-LEVEL FUNCTIONS:")
+    parts.append(_render_section(
+        f"  Missing from numpy-ts ({len(missing_toplevel)}):",
+        missing_toplevel))
 
     if extra_toplevel:
-        print(f"\n  Extra in numpy-ts (not in NumPy, {len(extra_toplevel)}):")
-        for i, func in enumerate(sorted(extra_toplevel), 1):
-            print(f"    {i:3d}. {func}")
+        parts.append(_render_section(
+            f"\n  Extra in numpy-ts (not in NumPy, {len(extra_toplevel)}):",
+            extra_toplevel))
 
     # Method gaps
     missing_methods = numpy_methods - numpyts_methods
     extra_methods = numpyts_methods - numpy_methods
 
-    print("\nNDARRAY METHODS:")
-    print(f"  Missing from NDArray ({len(missing_methods)}):")
-    for i, method in enumerate(sorted(missing_methods), 1):
-        print(f"    {i:3d}. {method}")
+    parts.append("\nNDARRAY METHODS:")
+    parts.append(_render_section(
+        f"  Missing from NDArray ({len(missing_methods)}):",
+        missing_methods))
 
     if extra_methods:
-        print(f"\n  Extra in NDArray (not in ndarray, {len(extra_methods)}):")
-        for i, method in enumerate(sorted(extra_methods), 1):
-            print(f"    {i:3d}. {method}")
+        parts.append(_render_section(
+            f"\n  Extra in NDArray (not in ndarray, {len(extra_methods)}):",
+            extra_methods))
 
-    print("\n" + "=" * 70)
+    parts.append("\n" + "=" * 70)
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
-def analyze_coverage(verbose=False):
-    """Analyze API coverage between NumPy and numpy-ts."""
+def compute_coverage():
+    """Compute coverage statistics from the audit JSON files."""
     numpy_audit = load_json('numpy-api-audit.json')
     numpyts_audit = load_json('numpyts-api-audit.json')
 
-    # Get ALL NumPy top-level functions (from categorized)
-    numpy_toplevel = set()
-    for funcs in numpy_audit['categorized'].values():
-        numpy_toplevel.update(funcs)
-
-    # Get ALL numpy-ts top-level functions
-    numpyts_toplevel = set(numpyts_audit['all_functions'].keys())
-
-    # Get methods
-    numpy_methods = set(numpy_audit['ndarray_methods'].keys())
-    numpyts_methods = set(numpyts_audit['ndarray_methods'].keys())
-
-    print("=" * 70)
-    print("ACCURATE API COVERAGE ANALYSIS")
-    print("=" * 70)
+    sets = build_api_sets(numpy_audit, numpyts_audit)
+    numpy_toplevel = sets.numpy_toplevel
+    numpyts_toplevel = sets.numpyts_toplevel
+    numpy_methods = sets.numpy_methods
+    numpyts_methods = sets.numpyts_methods
 
     # Top-level comparison (ignoring if also methods)
-    toplevel_implemented = numpy_toplevel & numpyts_toplevel
+    toplevel_implemented = len(numpy_toplevel & numpyts_toplevel)
     toplevel_coverage = (
-        100 * len(toplevel_implemented) / len(numpy_toplevel)
+        100 * toplevel_implemented / len(numpy_toplevel)
         if numpy_toplevel else 0
     )
 
-    print("\nTOP-LEVEL FUNCTIONS (ignoring if also methods):")
-    print(f"  NumPy functions:         {len(numpy_toplevel)}")
-    print(f"  numpy-ts functions:      {len(numpyts_toplevel)}")
-    print(f"  Implemented:             {len(toplevel_implemented)}")
-    print(f"  Coverage:                "
-          f"{len(toplevel_implemented)}/{len(numpy_toplevel)} "
-          f"({toplevel_coverage:.1f}%)")
-
     # Methods comparison (ignoring if also functions)
-    methods_implemented = numpy_methods & numpyts_methods
+    methods_implemented = len(numpy_methods & numpyts_methods)
     methods_coverage = (
-        100 * len(methods_implemented) / len(numpy_methods)
+        100 * methods_implemented / len(numpy_methods)
         if numpy_methods else 0
     )
 
-    print("\nNDARRAY METHODS (ignoring if also functions):")
-    print(f"  NumPy methods:           {len(numpy_methods)}")
-    print(f"  numpy-ts methods:        {len(numpyts_methods)}")
-    print(f"  Implemented:             {len(methods_implemented)}")
-    print(f"  Coverage:                "
-          f"{len(methods_implemented)}/{len(numpy_methods)} "
-          f"({methods_coverage:.1f}%)")
-
     # Combined (for reference)
-    # Total unique = union of all
-    numpy_total = len(numpy_toplevel | numpy_methods)
-    numpyts_total = len(numpyts_toplevel | numpyts_methods)
+    # Total unique = union of all; numpyts_all already is that union, and
+    # NumPy's is counted without building it
+    numpy_total = len(numpy_toplevel) + len(numpy_methods - numpy_toplevel)
+    numpyts_total = len(sets.numpyts_all)
     overall_coverage = 100 * numpyts_total / numpy_total if numpy_total else 0
 
-    print("\nCOMBINED UNIQUE (functions ∪ methods):")
-    print(f"  NumPy total:             {numpy_total}")
-    print(f"  numpy-ts total:          {numpyts_total}")
-    print(f"  Overall coverage:        "
-          f"{numpyts_total}/{numpy_total} ({overall_coverage:.1f}%)")
-
-    # Category breakdown
-    print("\n" + "=" * 70)
-    print("CATEGORY BREAKDOWN (by top-level functions)")
-    print("=" * 70)
-
     category_stats = {}
-    # Use union for implementation check (function OR method)
-    numpyts_all = numpyts_toplevel | numpyts_methods
+    numpyts_all = sets.numpyts_all
 
-    for category, funcs in sorted(numpy_audit['categorized'].items()):
-        numpy_cat = set(funcs)
-        implemented = numpy_cat & numpyts_all
-        pct = 100 * len(implemented) / len(numpy_cat) if numpy_cat else 0
+    for category, funcs in sorted(sets.numpy_categories.items()):
+        # One membership probe per function partitions hits and misses
+        implemented = []
+        missing = []
+        for func in funcs:
+            (implemented if func in numpyts_all else missing).append(func)
+        total = len(funcs)
+        pct = 100 * len(implemented) / total if total else 0
 
         status = "✅" if pct == 100 else ("🟡" if pct >= 50 else "🔴")
 
         category_stats[category] = {
-            'total': len(numpy_cat),
+            'total': total,
             'implemented': len(implemented),
-            'missing': numpy_cat - numpyts_all,
+            'missing': missing,
             'percentage': pct,
-            'status': status
+            'status': status,
+            # Short forms shared by the README table and the summary
+            'complete_str': f"{len(implemented)}/{total}",
+            'pct_str': f"{pct:.0f}%"
         }
 
-        impl_str = f"{len(implemented):3d}/{len(numpy_cat):3d}"
-        pct_str = f"{pct:5.1f}%"
-        print(f"{category:35s} {impl_str} ({pct_str}) {status}")
-
-    # Print verbose gaps if requested
-    if verbose:
-        print_verbose_gaps(numpy_audit, numpyts_audit)
+    # Sort by percentage (complete first), once for the table and summary
+    sorted_cats = sorted(category_stats.items(), key=_by_pct_desc)
 
     return {
         'numpy_toplevel': len(numpy_toplevel),
         'numpyts_toplevel': len(numpyts_toplevel),
+        'toplevel_implemented': toplevel_implemented,
         'toplevel_coverage': toplevel_coverage,
         'numpy_methods': len(numpy_methods),
         'numpyts_methods': len(numpyts_methods),
+        'methods_implemented': methods_implemented,
         'methods_coverage': methods_coverage,
         'numpy_total': numpy_total,
         'numpyts_total': numpyts_total,
         'overall_coverage': overall_coverage,
         'category_stats': category_stats,
-        'numpy_audit': numpy_audit,
-        'numpyts_audit': numpyts_audit
+        'sorted_cats': sorted_cats,
+        'sets': sets
     }
 
 
-def generate_readme_table(category_stats):
-    """Generate markdown table for README."""
+def _analysis_cache_key():
+    """(mtime_ns, size) of the audit JSONs and this script."""
+    scripts_dir = Path(__file__).parent
+    key = []
+    for path in (scripts_dir / 'numpy-api-audit.json',
+                 scripts_dir / 'numpyts-api-audit.json',
+                 Path(__file__)):
+        st = path.stat()
+        key.append((st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+
+def load_cached_coverage(key):
+    """Return the cached analysis if it was computed for this key, else None."""
+    try:
+        cached_key, analysis = pickle.loads(ANALYSIS_CACHE.read_bytes())
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError,
+            ValueError, TypeError):
+        return None
+    return analysis if cached_key == key else None
+
+
+def save_cached_coverage(key, analysis):
+    """Store the analysis for the next run; caching is best-effort."""
+    try:
+        ANALYSIS_CACHE.write_bytes(pickle.dumps((key, analysis)))
+    except (OSError, pickle.PicklingError, AttributeError):
+        pass
+
+
+def print_coverage(analysis):
+    """Print the coverage summary and category breakdown."""
+    print("=" * 70)
+    print("ACCURATE API COVERAGE ANALYSIS")
+    print("=" * 70)
+
+    print("\nTOP-LEVEL FUNCTIONS (ignoring if also methods):")
+    print(f"  NumPy functions:         {analysis['numpy_toplevel']}")
+    print(f"  numpy-ts functions:      {analysis['numpyts_toplevel']}")
+    print(f"  Implemented:             {analysis['toplevel_implemented']}")
+    print(f"  Coverage:                "
+          f"{analysis['toplevel_implemented']}/{analysis['numpy_toplevel']} "
+          f"({analysis['toplevel_coverage']:.1f}%)")
+
+    print("\nNDARRAY METHODS (ignoring if also functions):")
+    print(f"  NumPy methods:           {analysis['numpy_methods']}")
+    print(f"  numpy-ts methods:        {analysis['numpyts_methods']}")
+    print(f"  Implemented:             {analysis['methods_implemented']}")
+    print(f"  Coverage:                "
+          f"{analysis['methods_implemented']}/{analysis['numpy_methods']} "
+          f"({analysis['methods_coverage']:.1f}%)")
+
+    print("\nCOMBINED UNIQUE (functions ∪ methods):")
+    print(f"  NumPy total:             {analysis['numpy_total']}")
+    print(f"  numpy-ts total:          {analysis['numpyts_total']}")
+    print(f"  Overall coverage:        "
+          f"{analysis['numpyts_total']}/{analysis['numpy_total']} "
+          f"({analysis['overall_coverage']:.1f}%)")
+
+    # Category breakdown
+    print("\n" + "=" * 70)
+    print("CATEGORY BREAKDOWN (by top-level functions)")
+    print("=" * 70)
+
+    # Rows in category name order (category_stats was filled sorted)
+    row_fmt = "{:35s} {:3d}/{:3d} ({:5.1f}%) {}".format
+    print("\n".join(
+        row_fmt(category, stats['implemented'], stats['total'],
+                stats['percentage'], stats['status'])
+        for category, stats in analysis['category_stats'].items()
+    ))
+
+
+def analyze_coverage(verbose=False):
+    """Analyze API coverage between NumPy and numpy-ts."""
+    # Reuse the last analysis while the audit JSONs (and this script) are
+    # unchanged; otherwise recompute and refresh the cache
+    key = _analysis_cache_key()
+    analysis = load_cached_coverage(key)
+    if analysis is None:
+        analysis = compute_coverage()
+        save_cached_coverage(key, analysis)
+
+    print_coverage(analysis)
+
+    # Print verbose gaps if requested
+    if verbose:
+        print_verbose_gaps(analysis['sets'])
+
+    return analysis
+
+
+def generate_readme_table(sorted_cats):
+    """Generate markdown table for README from percentage-sorted categories."""
     lines = []
     lines.append("| Category | Complete | Total | Status |")
     lines.append("|----------|----------|-------|--------|")
 
-    # Sort by percentage (complete first)
-    sorted_cats = sorted(
-        category_stats.items(),
-        key=lambda x: (-x[1]['percentage'], x[0])
-    )
-
     for category, stats in sorted_cats:
-        complete = f"{stats['implemented']}/{stats['total']}"
-        pct = f"{stats['percentage']:.0f}%"
-        status = stats['status']
-        category_md = f"**{category}**"
-        lines.append(f"| {category_md} | {complete} | {pct} | {status} |")
+        lines.append(
+            f"| **{category}** | {stats['complete_str']} | "
+            f"{stats['pct_str']} | {stats['status']} |"
+        )
 
     return "\n".join(lines)
 
@@ -244,8 +407,8 @@ def update_readme(analysis):
     """Update README.md with accurate statistics."""
     readme_path = Path(__file__).parent.parent / 'README.md'
 
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    original = readme_path.read_bytes()
+    content = original
 
     total_impl = analysis['numpyts_total']
     total_numpy = analysis['numpy_total']
@@ -262,58 +425,49 @@ def update_readme(analysis):
 
     # Update badge with proper URL encoding for percentage sign
     coverage_int = int(round(coverage))
-    old_badge_pattern = r'!\[numpy api coverage\]\(https://img\.shields\.io/badge/numpy_api_coverage-\d+%20%25-\w+\)'
     new_badge = f'![numpy api coverage](https://img.shields.io/badge/numpy_api_coverage-{coverage_int}%20%25-{color})'
-    content = re.sub(old_badge_pattern, new_badge, content)
+    content = BADGE_RE.sub(new_badge.encode(), content)
 
     # Update the "Why numpy-ts?" section
-    old_pattern = r'- \*\*📊 Extensive API\*\* — \*\*.*?\*\*'
     new_bullet = (
         f"- **📊 Extensive API** — **{total_impl} of {total_numpy} NumPy "
         f"functions ({coverage:.1f}% coverage)**"
     )
-    content = re.sub(old_pattern, new_bullet, content)
+    content = API_BULLET_RE.sub(new_bullet.encode(), content)
 
     # Update the API Coverage table
-    table = generate_readme_table(analysis['category_stats'])
+    table = generate_readme_table(analysis['sorted_cats'])
     overall_line = (
         f"\n**Overall: {total_impl}/{total_numpy} "
         f"functions ({coverage:.1f}% complete)**"
     )
 
     # Find and replace the table
-    # Use a more specific pattern to avoid exponential backtracking
-    table_pattern = (
-        r'### API Coverage\n\n'
-        r'Progress toward complete NumPy API compatibility:\n\n'
-        r'(?:\|[^\n]*\n)+'  # Match table rows (non-capturing, possessive)
-        r'\n?'  # Optional blank line before Overall
-        r'\*\*Overall:[^\n]*\n'
-    )
     new_table_section = (
         f"### API Coverage\n\n"
         f"Progress toward complete NumPy API compatibility:\n\n"
         f"{table}\n{overall_line}\n"
     )
 
-    content = re.sub(table_pattern, new_table_section, content,
-                     flags=re.DOTALL)
+    content = COVERAGE_TABLE_RE.sub(new_table_section.encode(), content)
 
     # Update architecture diagram
-    old_pattern = r'│  NumPy-Compatible API \(.*?\)   │'
     new_arch = f"│  NumPy-Compatible API ({total_impl}/{total_numpy})   │"
-    content = re.sub(old_pattern, new_arch, content)
+    content = ARCH_DIAGRAM_RE.sub(new_arch.encode(), content)
 
     # Update comparison table
-    old_pattern = r'\| NumPy API Coverage \| .*? \|'
     new_comp = (
         f"| NumPy API Coverage | "
         f"{total_impl}/{total_numpy} ({coverage:.0f}%) |"
     )
-    content = re.sub(old_pattern, new_comp, content)
+    content = COMPARISON_ROW_RE.sub(new_comp.encode(), content)
 
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Leave the file (and its mtime) alone when nothing changed
+    if content == original:
+        print(f"\n✅ {readme_path} already up to date")
+        return
+
+    readme_path.write_bytes(content)
 
     print(f"\n✅ Updated {readme_path}")
 
@@ -328,12 +482,21 @@ def main():
         action='store_true',
         help='Show detailed list of missing and extra functions'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-run the audits even if their JSON output is up to date'
+    )
     args = parser.parse_args()
 
     print("Comparing numpy-ts vs NumPy and updating documentation...\n")
 
-    # Run audits first to get fresh data
-    run_audits()
+    # Run audits first to get fresh data, unless nothing they read changed
+    if args.force or not audits_up_to_date():
+        run_audits()
+    else:
+        print("Audit data is up to date, skipping audits "
+              "(use --force to re-run)\n")
 
     # Analyze coverage
     analysis = analyze_coverage(verbose=args.verbose)
@@ -353,19 +516,21 @@ def main():
     print(f"NDArray methods: {analysis['methods_coverage']:.1f}% coverage")
 
     print("\nTop completing categories:")
-    sorted_cats = sorted(
-        analysis['category_stats'].items(),
-        key=lambda x: -x[1]['percentage']
-    )
-    for cat, stats in sorted_cats[:5]:
-        print(f"  {cat:30s} {stats['percentage']:5.1f}%")
+    sorted_cats = analysis['sorted_cats']
+    top_fmt = "  {:30s} {:5.1f}%".format
+    print("\n".join(
+        top_fmt(cat, stats['percentage']) for cat, stats in sorted_cats[:5]
+    ))
 
     print("\nNext priorities (50-90% complete):")
-    for cat, stats in sorted_cats:
-        if 50 <= stats['percentage'] < 90:
-            missing_list = ', '.join(sorted(stats['missing'])[:3])
-            pct_str = f"{stats['percentage']:.0f}%"
-            print(f"  {cat:30s} ({pct_str}) - Need: {missing_list}")
+    # sorted_cats is descending by percentage: skip >=90%, stop below 50%
+    priorities = takewhile(
+        lambda x: x[1]['percentage'] >= 50,
+        dropwhile(lambda x: x[1]['percentage'] >= 90, sorted_cats)
+    )
+    for cat, stats in priorities:
+        missing_list = ', '.join(heapq.nsmallest(3, stats['missing']))
+        print(f"  {cat:30s} ({stats['pct_str']}) - Need: {missing_list}")
 
     print("\n" + "=" * 70)
     if args.verbose: